@@ -4,6 +4,7 @@ Setup script for Map Dater.
 
 from setuptools import setup, find_packages
 from pathlib import Path
+import os
 
 # Read README
 readme_path = Path(__file__).parent / 'README.md'
@@ -20,6 +21,20 @@ if requirements_path.exists():
             if line.strip() and not line.startswith('#')
         ]
 
+# Optional: compile the scoring module to a C extension with mypyc
+# (MAP_DATER_MYPYC=1 pip install .). The pure-Python module is used otherwise.
+ext_modules = []
+if os.environ.get('MAP_DATER_MYPYC') == '1':
+    from mypyc.build import mypycify
+
+    os.environ.setdefault('MYPYPATH', 'src')
+    ext_modules = mypycify([
+        '--explicit-package-bases',
+        '--follow-imports=silent',
+        '--ignore-missing-imports',
+        'src/scoring/score_calculator.py',
+    ])
+
 setup(
     name='map-dater',
     version='0.1.0',
@@ -32,6 +47,7 @@ setup(
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
     install_requires=requirements,
+    ext_modules=ext_modules,
     python_requires='>=3.8',
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -99,12 +99,10 @@ class GameEngine:
         if self.current_round is None:
             raise RuntimeError("No active round. Call start_new_round() first.")
 
-        # Calculate score
-        score = self.score_calculator.calculate_score(guess, self.current_round)
-
-        # Check accuracy
-        was_accurate = self.score_calculator.is_accurate(guess, self.current_round)
-        was_exact = self.score_calculator.is_exact(guess, self.current_round)
+        # Calculate score and check accuracy
+        was_accurate, was_exact, score = self.score_calculator.evaluate(
+            guess, self.current_round
+        )
 
         # Generate feedback
         feedback_gen = FeedbackGenerator(difficulty=self.current_round.difficulty)
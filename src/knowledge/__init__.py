@@ -1,5 +1,6 @@
 """Historical knowledge base module."""
 
 from .knowledge_base import HistoricalKnowledgeBase
+from .entity_index import EntityIntervalIndex
 
-__all__ = ["HistoricalKnowledgeBase"]
+__all__ = ["HistoricalKnowledgeBase", "EntityIntervalIndex"]
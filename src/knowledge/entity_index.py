@@ -0,0 +1,102 @@
+"""
+Interval index over entity validity ranges.
+
+Answers "which entities existed in year Y" in O(log n + k) instead of
+scanning every entity.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from pathlib import Path
+import sys
+
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+from models import HistoricalEntity
+
+
+# (start, end, position in the input sequence)
+_Interval = Tuple[int, int, int]
+
+
+class _Node:
+    """Node of a centered interval tree."""
+
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, intervals: List[_Interval]):
+        endpoints = sorted(v for start, end, _ in intervals for v in (start, end))
+        self.center = endpoints[len(endpoints) // 2]
+
+        here, left, right = [], [], []
+        for iv in intervals:
+            if iv[1] < self.center:
+                left.append(iv)
+            elif iv[0] > self.center:
+                right.append(iv)
+            else:
+                here.append(iv)
+
+        # Intervals containing center, ascending by start / descending by end
+        self.by_start = sorted(here, key=lambda iv: iv[0])
+        self.by_end = sorted(here, key=lambda iv: iv[1], reverse=True)
+        self.left: Optional[_Node] = _Node(left) if left else None
+        self.right: Optional[_Node] = _Node(right) if right else None
+
+
+class EntityIntervalIndex:
+    """
+    Centered interval tree over entities' valid_range.
+
+    Built once from a sequence of entities; build a new index if the
+    entities change.
+    """
+
+    def __init__(self, entities: Sequence[HistoricalEntity]):
+        """
+        Build the index.
+
+        Args:
+            entities: Entities to index
+        """
+        self._entities = list(entities)
+        intervals = [
+            (e.valid_range.start, e.valid_range.end, i)
+            for i, e in enumerate(self._entities)
+        ]
+        self._root = _Node(intervals) if intervals else None
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def valid_in(self, year: int) -> List[HistoricalEntity]:
+        """
+        Get all indexed entities that existed in a year.
+
+        Args:
+            year: Year to check
+
+        Returns:
+            Entities valid in that year, in the order they were indexed
+        """
+        hits: List[int] = []
+        node = self._root
+        while node is not None:
+            if year < node.center:
+                for start, _, i in node.by_start:
+                    if start > year:
+                        break
+                    hits.append(i)
+                node = node.left
+            elif year > node.center:
+                for _, end, i in node.by_end:
+                    if end < year:
+                        break
+                    hits.append(i)
+                node = node.right
+            else:
+                hits.extend(i for _, _, i in node.by_start)
+                break
+
+        hits.sort()
+        return [self._entities[i] for i in hits]
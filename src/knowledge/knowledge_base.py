@@ -11,6 +11,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from models import HistoricalEntity, YearRange
+from .entity_index import EntityIntervalIndex
 
 
 class HistoricalKnowledgeBase:
@@ -27,6 +28,8 @@ class HistoricalKnowledgeBase:
     def __init__(self):
         """Initialize the knowledge base with core historical facts."""
         self.entities: List[HistoricalEntity] = []
+        # Built on first year query; cleared whenever an entity is added
+        self._year_index: Optional[EntityIntervalIndex] = None
         self._load_default_entities()
 
     def _load_default_entities(self):
@@ -328,6 +331,7 @@ class HistoricalKnowledgeBase:
             entity: HistoricalEntity to add
         """
         self.entities.append(entity)
+        self._year_index = None
 
     def all_entities(self) -> List[HistoricalEntity]:
         """
@@ -360,7 +364,9 @@ class HistoricalKnowledgeBase:
         Returns:
             List of entities valid in that year
         """
-        return [e for e in self.entities if e.was_valid_in(year)]
+        if self._year_index is None or len(self._year_index) != len(self.entities):
+            self._year_index = EntityIntervalIndex(self.entities)
+        return self._year_index.valid_in(year)
 
     def find_by_name(self, name: str) -> Optional[HistoricalEntity]:
         """
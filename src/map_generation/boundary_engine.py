@@ -7,6 +7,7 @@ with fallback to simplified templates.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Tuple, Optional, Any
 import math
 import sys
@@ -22,6 +23,11 @@ from .geo_data_fetcher import GeoDataFetcher, GeoDataResult, GeoFeature
 @dataclass
 class Point:
     """A 2D point (latitude, longitude or pixel coordinates)."""
+    # Built per vertex, so no instance dict. Declared by hand (not
+    # slots=True) to keep Python 3.8 support; not frozen, since a frozen
+    # __init__ assigns through object.__setattr__ and is ~2x slower.
+    __slots__ = ('x', 'y')
+
     x: float
     y: float
 
@@ -29,6 +35,17 @@ class Point:
         return (self.x, self.y)
 
 
+def _mean_point(points: List[Point]) -> Point:
+    """Vertex average of a point list (Point(0, 0) when empty)."""
+    if not points:
+        return Point(0, 0)
+
+    sum_x = sum(p.x for p in points)
+    sum_y = sum(p.y for p in points)
+    n = len(points)
+    return Point(sum_x / n, sum_y / n)
+
+
 @dataclass
 class Polygon:
     """
@@ -52,23 +69,22 @@ class Polygon:
     uncertainty: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    @property
+    @cached_property
     def centroid(self) -> Point:
-        """Calculate the centroid of the polygon."""
-        if not self.points:
-            return Point(0, 0)
+        """
+        Calculate the centroid of the polygon.
 
-        sum_x = sum(p.x for p in self.points)
-        sum_y = sum(p.y for p in self.points)
-        n = len(self.points)
-        return Point(sum_x / n, sum_y / n)
+        Computed on first access and cached; points must not be modified
+        afterwards.
+        """
+        return _mean_point(self.points)
 
     def get_label_position(self) -> Point:
         """Get the position for labeling this polygon."""
         return self.label_position or self.centroid
 
 
-@dataclass
+@dataclass(frozen=True)
 class UncertaintyRegion:
     """
     A region with uncertain or disputed boundaries.
@@ -460,13 +476,7 @@ class BoundaryEngine:
 
     def _calculate_centroid(self, points: List[Point]) -> Point:
         """Calculate the centroid of a polygon."""
-        if not points:
-            return Point(0, 0)
-
-        sum_x = sum(p.x for p in points)
-        sum_y = sum(p.y for p in points)
-        n = len(points)
-        return Point(sum_x / n, sum_y / n)
+        return _mean_point(points)
 
     def _create_entity_polygon(
         self,
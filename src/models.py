@@ -5,9 +5,13 @@ These models define the data structures used throughout the pipeline.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
 from enum import Enum
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class SignalType(Enum):
     """Types of dating signals that can be extracted from maps."""
@@ -35,7 +39,7 @@ class TextBlock:
     normalized_text: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class YearRange:
     """Represents a temporal range with optional uncertainty."""
     start: int
@@ -45,41 +49,94 @@ class YearRange:
         if self.start > self.end:
             raise ValueError(f"Invalid range: {self.start} > {self.end}")
 
+    @classmethod
+    def _unchecked(cls, start: int, end: int) -> 'YearRange':
+        """
+        Build a range without validation.
+
+        Only for internal callers that already guarantee start <= end.
+        """
+        yr = object.__new__(cls)
+        object.__setattr__(yr, 'start', start)
+        object.__setattr__(yr, 'end', end)
+        return yr
+
     def overlaps(self, other: 'YearRange') -> bool:
         """Check if this range overlaps with another."""
         return self.start <= other.end and other.start <= self.end
 
+    @staticmethod
+    def overlaps_batch(
+        a_starts: 'np.ndarray',
+        a_ends: 'np.ndarray',
+        b_starts: 'np.ndarray',
+        b_ends: 'np.ndarray'
+    ) -> 'np.ndarray':
+        """
+        Pairwise overlap test between two sets of ranges.
+
+        The comparison runs in the inputs' dtype; years fit int16, which
+        packs twice as many lanes per SIMD register as int32.
+
+        Args:
+            a_starts, a_ends: Bounds of the N ranges on the left
+            b_starts, b_ends: Bounds of the M ranges on the right
+
+        Returns:
+            (N, M) bool array; [i, j] is True iff range a[i] overlaps b[j]
+        """
+        # Imported here so the models stay importable without numpy
+        import numpy as np
+
+        a_starts = np.asarray(a_starts)[:, None]
+        a_ends = np.asarray(a_ends)[:, None]
+        return (a_starts <= np.asarray(b_ends)) & (np.asarray(b_starts) <= a_ends)
+
     def intersection(self, other: 'YearRange') -> Optional['YearRange']:
         """Return the intersection of two ranges, or None if they don't overlap."""
-        if not self.overlaps(other):
+        start = self.start if self.start > other.start else other.start
+        end = self.end if self.end < other.end else other.end
+        if start > end:
             return None
-        return YearRange(
-            start=max(self.start, other.start),
-            end=min(self.end, other.end)
-        )
+        # Overlapping ranges always intersect in a valid range
+        return YearRange._unchecked(start, end)
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _label(self) -> str:
+        """
+        Display form of the range ("1945" or "1900-1950").
+
+        Formatted on first access and cached (the range is immutable).
+        """
         if self.start == self.end:
             return f"{self.start}"
         return f"{self.start}-{self.end}"
 
+    def __repr__(self) -> str:
+        return self._label
 
-@dataclass
+
+@dataclass(frozen=True)
 class HistoricalEntity:
     """A named entity with temporal validity."""
     name: str
     canonical_name: str
     entity_type: str  # "country", "city", "region", "empire", etc.
     valid_range: YearRange
-    alternative_names: List[str] = field(default_factory=list)
-    context: Dict[str, Any] = field(default_factory=dict)
+    alternative_names: Tuple[str, ...] = ()
+    # Free-form extra data; not part of equality or the hash
+    context: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable of names (e.g. a list from JSON)
+        object.__setattr__(self, 'alternative_names', tuple(self.alternative_names))
 
     def was_valid_in(self, year: int) -> bool:
         """Check if this entity existed in a given year."""
         return self.valid_range.start <= year <= self.valid_range.end
 
 
-@dataclass
+@dataclass(frozen=True)
 class DateSignal:
     """A single piece of evidence for dating a map."""
     signal_type: SignalType
@@ -118,9 +175,11 @@ class ProcessedImage:
     width: int
     height: int
     preprocessing_applied: List[str] = field(default_factory=list)
+    # Encoded payloads (e.g. base64 JPEG for the vision API), keyed by encoder
+    encoded_cache: Dict[Any, str] = field(default_factory=dict, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True)
 class VisualFeature:
     """Placeholder for visual features (borders, colors, etc.)."""
     feature_type: str
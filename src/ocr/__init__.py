@@ -1,6 +1,7 @@
 """OCR and text extraction module."""
 
+from .text_block_batch import TextBlockBatch
 from .text_extractor import TextExtractor
 from .visualizer import OCRVisualizer
 
-__all__ = ["TextExtractor", "OCRVisualizer"]
+__all__ = ["TextBlockBatch", "TextExtractor", "OCRVisualizer"]
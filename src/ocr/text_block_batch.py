@@ -0,0 +1,74 @@
+"""
+Column-oriented batches of OCR text blocks.
+
+Kept in the OCR package (rather than models) so that the core models do
+not require numpy.
+"""
+
+from dataclasses import dataclass
+from typing import List
+from pathlib import Path
+import sys
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from models import TextBlock
+
+
+@dataclass
+class TextBlockBatch:
+    """
+    Column-oriented (structure-of-arrays) view of a list of TextBlocks.
+
+    Coordinates and confidences are held in contiguous numpy arrays so
+    visualization code can clamp, stack and fill boxes in vectorized form.
+    """
+    xs: np.ndarray  # int32
+    ys: np.ndarray  # int32
+    ws: np.ndarray  # int32
+    hs: np.ndarray  # int32
+    confs: np.ndarray  # float32, 0.0 to 1.0
+    texts: List[str]
+
+    def __post_init__(self):
+        n = len(self.xs)
+        if not (len(self.ys) == len(self.ws) == len(self.hs)
+                == len(self.confs) == len(self.texts) == n):
+            raise ValueError("TextBlockBatch columns must all have the same length")
+
+    @classmethod
+    def from_text_blocks(cls, text_blocks: List[TextBlock]) -> 'TextBlockBatch':
+        """Build a batch from a list of TextBlocks."""
+        n = len(text_blocks)
+        coords = np.fromiter(
+            (v for b in text_blocks
+             for v in (b.bbox.x, b.bbox.y, b.bbox.width, b.bbox.height)),
+            dtype=np.int32,
+            count=4 * n
+        ).reshape(n, 4)
+        confs = np.fromiter(
+            (b.confidence for b in text_blocks), dtype=np.float32, count=n
+        )
+        return cls(
+            xs=coords[:, 0].copy(),
+            ys=coords[:, 1].copy(),
+            ws=coords[:, 2].copy(),
+            hs=coords[:, 3].copy(),
+            confs=confs,
+            texts=[b.text for b in text_blocks]
+        )
+
+    def take(self, indices: np.ndarray) -> 'TextBlockBatch':
+        """Return a new batch containing only the given block indices."""
+        return TextBlockBatch(
+            xs=self.xs[indices],
+            ys=self.ys[indices],
+            ws=self.ws[indices],
+            hs=self.hs[indices],
+            confs=self.confs[indices],
+            texts=[self.texts[i] for i in indices]
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
@@ -20,6 +20,7 @@ import numpy as np
 
 sys.path.append(str(Path(__file__).parent.parent))
 from models import TextBlock, BoundingBox, ProcessedImage
+from .text_block_batch import TextBlockBatch
 
 
 class TextExtractor:
@@ -134,6 +135,18 @@ class TextExtractor:
 
         return text_blocks
 
+    def extract_text_batch(self, processed_image: ProcessedImage) -> TextBlockBatch:
+        """
+        Extract text blocks in column-oriented form for visualization.
+
+        Args:
+            processed_image: Preprocessed map image
+
+        Returns:
+            TextBlockBatch with coordinates and confidences as numpy arrays
+        """
+        return TextBlockBatch.from_text_blocks(self.extract_text(processed_image))
+
     def normalize_text(self, text: str) -> str:
         """
         Normalize extracted text for entity matching.
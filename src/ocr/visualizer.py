@@ -5,7 +5,8 @@ Creates visual representations of text detection results.
 """
 
 import numpy as np
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from pathlib import Path
 import sys
 
@@ -14,8 +15,108 @@ try:
 except ImportError:
     cv2 = None
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 sys.path.append(str(Path(__file__).parent.parent))
 from models import TextBlock, ProcessedImage
+from .text_block_batch import TextBlockBatch
+
+
+def _as_batch(text_blocks: Union[List[TextBlock], TextBlockBatch]) -> TextBlockBatch:
+    """Accept either a list of TextBlocks or a prebuilt TextBlockBatch."""
+    if isinstance(text_blocks, TextBlockBatch):
+        return text_blocks
+    return TextBlockBatch.from_text_blocks(text_blocks)
+
+
+def _dedupe(batch: TextBlockBatch) -> TextBlockBatch:
+    """
+    Drop duplicate detections (same text and size, origin in the same 4px cell).
+
+    Tesseract sometimes reports the same word more than once; drawing it
+    twice only costs time and produces overlapping labels.
+    """
+    seen = set()
+    keep = []
+    xs = (batch.xs // 4).tolist()
+    ys = (batch.ys // 4).tolist()
+    for i, key in enumerate(zip(xs, ys, batch.ws.tolist(), batch.hs.tolist(), batch.texts)):
+        if key not in seen:
+            seen.add(key)
+            keep.append(i)
+    if len(keep) == len(batch):
+        return batch
+    return batch.take(np.array(keep, dtype=np.intp))
+
+
+# Images with at least this many pixels use the parallel numba prefix sum
+# (when numba is installed); smaller ones use numpy's cumsum.
+_NUMBA_HEATMAP_MIN_PIXELS = 4096 * 4096
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fill_heatmap(diff, out, H, W):
+        """2D prefix sum of diff[:H, :W] into out, parallel over rows then columns."""
+        for r in prange(H):
+            row_acc = 0.0
+            for c in range(W):
+                row_acc += diff[r, c]
+                out[r, c] = row_acc
+        for c in prange(W):
+            col_acc = 0.0
+            for r in range(H):
+                col_acc += out[r, c]
+                out[r, c] = col_acc
+else:
+    _fill_heatmap = None
+
+
+def _confidence_heatmap(batch: TextBlockBatch, height: int, width: int) -> np.ndarray:
+    """
+    Rasterize block confidences into a (height, width) float32 map.
+
+    Boxes are clipped to the image. Overlapping boxes accumulate and are
+    capped at full confidence.
+    """
+    # Ensure coordinates are within bounds
+    x1 = np.maximum(0, batch.xs)
+    y1 = np.maximum(0, batch.ys)
+    x2 = np.minimum(width, batch.xs + batch.ws)
+    y2 = np.minimum(height, batch.ys + batch.hs)
+    keep = (x2 > x1) & (y2 > y1)
+    x1, y1, x2, y2 = x1[keep], y1[keep], x2[keep], y2[keep]
+    confs = batch.confs[keep]
+
+    # 2D difference array: mark each box's corners, then a prefix sum
+    # over both axes fills every box in O(H*W) regardless of box count
+    diff = np.zeros((height + 1, width + 1), dtype=np.float32)
+    np.add.at(diff, (y1, x1), confs)
+    np.add.at(diff, (y1, x2), -confs)
+    np.add.at(diff, (y2, x1), -confs)
+    np.add.at(diff, (y2, x2), confs)
+    if _fill_heatmap is not None and height * width >= _NUMBA_HEATMAP_MIN_PIXELS:
+        heatmap = np.empty((height, width), dtype=np.float32)
+        _fill_heatmap(diff, heatmap, height, width)
+    else:
+        heatmap = diff.cumsum(axis=0).cumsum(axis=1)[:height, :width]
+    np.clip(heatmap, 0.0, 1.0, out=heatmap)
+    return heatmap
+
+
+@lru_cache(maxsize=4096)
+def _label_size(label: str, font_scale: float) -> Tuple[int, int]:
+    """Memoized cv2.getTextSize for labels repeated across blocks and maps."""
+    (label_width, label_height), _ = cv2.getTextSize(
+        label,
+        cv2.FONT_HERSHEY_SIMPLEX,
+        font_scale,
+        1
+    )
+    return label_width, label_height
 
 
 class OCRVisualizer:
@@ -55,68 +156,79 @@ class OCRVisualizer:
     def visualize_text_blocks(
         self,
         processed_image: ProcessedImage,
-        text_blocks: List[TextBlock],
-        output_path: Optional[str] = None
+        text_blocks: Union[List[TextBlock], TextBlockBatch],
+        output_path: Optional[str] = None,
+        draw_labels: bool = True
     ) -> np.ndarray:
         """
         Draw bounding boxes around detected text.
 
         Args:
             processed_image: The processed image
-            text_blocks: List of detected text blocks
+            text_blocks: Detected text blocks (list or TextBlockBatch)
             output_path: Optional path to save the visualization
+            draw_labels: Whether to draw a text label above each box
 
         Returns:
             Image with bounding boxes drawn
         """
+        batch = _dedupe(_as_batch(text_blocks))
+
         # Create a copy to draw on
         image = processed_image.image_data.copy()
 
-        for block in text_blocks:
-            # Draw bounding box
-            x, y, w, h = block.bbox.x, block.bbox.y, block.bbox.width, block.bbox.height
-            cv2.rectangle(
+        # Draw all bounding boxes in one call from an (N, 4, 2) corner array
+        if len(batch):
+            x2 = batch.xs + batch.ws
+            y2 = batch.ys + batch.hs
+            corners = np.stack([
+                np.stack([batch.xs, batch.ys], axis=1),
+                np.stack([x2, batch.ys], axis=1),
+                np.stack([x2, y2], axis=1),
+                np.stack([batch.xs, y2], axis=1),
+            ], axis=1).astype(np.int32)
+            cv2.polylines(
                 image,
-                (x, y),
-                (x + w, y + h),
+                list(corners),
+                True,
                 self.box_color,
                 self.box_thickness
             )
 
-            # Prepare label
-            if self.show_confidence:
-                label = f"{block.text} ({block.confidence:.2f})"
-            else:
-                label = block.text
-
-            # Draw label background
-            (label_width, label_height), _ = cv2.getTextSize(
-                label,
-                cv2.FONT_HERSHEY_SIMPLEX,
-                self.font_scale,
-                1
-            )
-
-            # Draw filled rectangle for text background
-            cv2.rectangle(
-                image,
-                (x, y - label_height - 5),
-                (x + label_width, y),
-                self.box_color,
-                -1  # Filled
-            )
-
-            # Draw text
-            cv2.putText(
-                image,
-                label,
-                (x, y - 5),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                self.font_scale,
-                self.text_color,
-                1,
-                cv2.LINE_AA
-            )
+        # Label rendering dominates per-block cost; skip it when not needed
+        if draw_labels:
+            for x, y, text, conf in zip(
+                batch.xs.tolist(), batch.ys.tolist(), batch.texts, batch.confs.tolist()
+            ):
+                # Prepare label
+                if self.show_confidence:
+                    label = f"{text} ({conf:.2f})"
+                else:
+                    label = text
+
+                # Draw label background
+                label_width, label_height = _label_size(label, self.font_scale)
+
+                # Draw filled rectangle for text background
+                cv2.rectangle(
+                    image,
+                    (x, y - label_height - 5),
+                    (x + label_width, y),
+                    self.box_color,
+                    -1  # Filled
+                )
+
+                # Draw text
+                cv2.putText(
+                    image,
+                    label,
+                    (x, y - 5),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    self.font_scale,
+                    self.text_color,
+                    1,
+                    cv2.LINE_AA
+                )
 
         if output_path:
             cv2.imwrite(output_path, image)
@@ -126,7 +238,7 @@ class OCRVisualizer:
     def create_word_map(
         self,
         processed_image: ProcessedImage,
-        text_blocks: List[TextBlock],
+        text_blocks: Union[List[TextBlock], TextBlockBatch],
         output_path: Optional[str] = None,
         background_color: Tuple[int, int, int] = (255, 255, 255)
     ) -> np.ndarray:
@@ -137,7 +249,7 @@ class OCRVisualizer:
 
         Args:
             processed_image: The processed image
-            text_blocks: List of detected text blocks
+            text_blocks: Detected text blocks (list or TextBlockBatch)
             output_path: Optional path to save the word map
             background_color: Background color for the word map
 
@@ -148,16 +260,18 @@ class OCRVisualizer:
         height, width = processed_image.height, processed_image.width
         word_map = np.full((height, width, 3), background_color, dtype=np.uint8)
 
-        for block in text_blocks:
-            x, y, w, h = block.bbox.x, block.bbox.y, block.bbox.width, block.bbox.height
+        batch = _as_batch(text_blocks)
 
+        for x, y, h, text in zip(
+            batch.xs.tolist(), batch.ys.tolist(), batch.hs.tolist(), batch.texts
+        ):
             # Calculate font size based on bounding box height
             font_scale = h / 30.0  # Approximate scaling
 
             # Draw text at original position
             cv2.putText(
                 word_map,
-                block.text,
+                text,
                 (x, y + h - 5),  # Align to bottom of bbox
                 cv2.FONT_HERSHEY_SIMPLEX,
                 font_scale,
@@ -174,7 +288,7 @@ class OCRVisualizer:
     def create_heatmap(
         self,
         processed_image: ProcessedImage,
-        text_blocks: List[TextBlock],
+        text_blocks: Union[List[TextBlock], TextBlockBatch],
         output_path: Optional[str] = None
     ) -> np.ndarray:
         """
@@ -182,23 +296,16 @@ class OCRVisualizer:
 
         Args:
             processed_image: The processed image
-            text_blocks: List of detected text blocks
+            text_blocks: Detected text blocks (list or TextBlockBatch)
             output_path: Optional path to save the heatmap
 
         Returns:
             Heatmap image
         """
         # Create grayscale heatmap
-        height, width = processed_image.height, processed_image.width
-        heatmap = np.zeros((height, width), dtype=np.float32)
-
-        for block in text_blocks:
-            x, y, w, h = block.bbox.x, block.bbox.y, block.bbox.width, block.bbox.height
-            # Ensure coordinates are within bounds
-            x1, y1 = max(0, x), max(0, y)
-            x2, y2 = min(width, x + w), min(height, y + h)
-
-            heatmap[y1:y2, x1:x2] = block.confidence
+        heatmap = _confidence_heatmap(
+            _as_batch(text_blocks), processed_image.height, processed_image.width
+        )
 
         # Convert to color heatmap
         heatmap_normalized = (heatmap * 255).astype(np.uint8)
@@ -221,7 +328,7 @@ class OCRVisualizer:
     def create_summary_visualization(
         self,
         processed_image: ProcessedImage,
-        text_blocks: List[TextBlock],
+        text_blocks: Union[List[TextBlock], TextBlockBatch],
         output_path: Optional[str] = None
     ) -> np.ndarray:
         """
@@ -229,16 +336,19 @@ class OCRVisualizer:
 
         Args:
             processed_image: The processed image
-            text_blocks: List of detected text blocks
+            text_blocks: Detected text blocks (list or TextBlockBatch)
             output_path: Optional path to save the summary
 
         Returns:
             Summary visualization image
         """
+        batch = _as_batch(text_blocks)
+
         # Create all visualizations
-        bbox_vis = self.visualize_text_blocks(processed_image, text_blocks)
-        word_map = self.create_word_map(processed_image, text_blocks)
-        heatmap = self.create_heatmap(processed_image, text_blocks)
+        # The word map panel already shows the text, so skip box labels here
+        bbox_vis = self.visualize_text_blocks(processed_image, batch, draw_labels=False)
+        word_map = self.create_word_map(processed_image, batch)
+        heatmap = self.create_heatmap(processed_image, batch)
 
         # Resize to same height for horizontal stacking
         target_height = 600
@@ -5,7 +5,7 @@ This module coordinates all components to analyze a map and estimate its date.
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import sys
 
 sys.path.append(str(Path(__file__).parent))
@@ -84,6 +84,10 @@ class MapDaterPipeline:
         self.verbose = verbose
         self.enable_visual_features = enable_visual_features
 
+        # Verbose progress lines, buffered per analyze_map call and
+        # written to stdout in one go when the call finishes
+        self._log: Optional[List[str]] = None
+
     def analyze_map(
         self,
         image_path: str,
@@ -103,43 +107,57 @@ class MapDaterPipeline:
             FileNotFoundError: If image doesn't exist
             ValueError: If analysis fails
         """
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print(f"ANALYZING MAP: {image_path}")
-            print(f"{'='*60}\n")
+        self._log = [] if self.verbose else None
+        try:
+            return self._analyze_map(image_path, save_processed_image)
+        finally:
+            if self._log:
+                sys.stdout.write('\n'.join(self._log) + '\n')
+                sys.stdout.flush()
+            self._log = None
+
+    def _log_line(self, msg: str = "") -> None:
+        """Buffer a verbose progress message (no-op when not verbose)."""
+        if self._log is not None:
+            self._log.append(msg)
+
+    def _analyze_map(
+        self,
+        image_path: str,
+        save_processed_image: Optional[str]
+    ) -> DateEstimate:
+        """Run the analysis steps, buffering progress output in self._log."""
+        self._log_line(f"\n{'='*60}")
+        self._log_line(f"ANALYZING MAP: {image_path}")
+        self._log_line(f"{'='*60}\n")
 
         # Step 1: Preprocess image
-        if self.verbose:
-            print("Step 1: Preprocessing image...")
+        self._log_line("Step 1: Preprocessing image...")
 
         processed_image = self.preprocessor.process(image_path)
 
         if save_processed_image:
             self.preprocessor.save_processed_image(processed_image, save_processed_image)
-            if self.verbose:
-                print(f"  → Saved preprocessed image to {save_processed_image}")
+            self._log_line(f"  → Saved preprocessed image to {save_processed_image}")
 
         # Step 2: Extract text
-        if self.verbose:
-            print("\nStep 2: Extracting text (OCR)...")
+        self._log_line("\nStep 2: Extracting text (OCR)...")
 
         text_blocks = self.text_extractor.extract_text(processed_image)
 
-        if self.verbose:
-            print(f"  → Found {len(text_blocks)} text blocks")
+        self._log_line(f"  → Found {len(text_blocks)} text blocks")
 
         # Step 3: Extract historical entities
-        if self.verbose:
-            print("\nStep 3: Recognizing historical entities...")
+        self._log_line("\nStep 3: Recognizing historical entities...")
 
         entities = self.entity_recognizer.extract_entities(text_blocks)
 
         if self.verbose:
-            print(f"  → Identified {len(entities)} historical entities:")
+            self._log_line(f"  → Identified {len(entities)} historical entities:")
             for entity in entities[:5]:  # Show first 5
-                print(f"     - {entity.canonical_name} ({entity.valid_range})")
+                self._log_line(f"     - {entity.canonical_name} ({entity.valid_range})")
             if len(entities) > 5:
-                print(f"     ... and {len(entities) - 5} more")
+                self._log_line(f"     ... and {len(entities) - 5} more")
 
         if not entities:
             raise ValueError(
@@ -150,32 +168,26 @@ class MapDaterPipeline:
         # Step 4: Extract visual features (if enabled)
         visual_features = []
         if self.enable_visual_features:
-            if self.verbose:
-                print("\nStep 4: Extracting visual features...")
+            self._log_line("\nStep 4: Extracting visual features...")
 
             visual_features = self.visual_extractor.extract_all_features(processed_image)
 
-            if self.verbose:
-                print(f"  → Extracted {len(visual_features)} visual features")
+            self._log_line(f"  → Extracted {len(visual_features)} visual features")
         else:
-            if self.verbose:
-                print("\nStep 4: Skipping visual features (disabled)")
+            self._log_line("\nStep 4: Skipping visual features (disabled)")
 
         # Step 5: Extract year references from text
-        if self.verbose:
-            print("\nStep 5: Searching for year references...")
+        self._log_line("\nStep 5: Searching for year references...")
 
         extracted_years = self.text_extractor.find_years(text_blocks)
 
-        if self.verbose:
-            if extracted_years:
-                print(f"  → Found years: {extracted_years}")
-            else:
-                print("  → No explicit years found")
+        if extracted_years:
+            self._log_line(f"  → Found years: {extracted_years}")
+        else:
+            self._log_line("  → No explicit years found")
 
         # Step 6: Estimate date
-        if self.verbose:
-            print("\nStep 6: Computing date estimate...")
+        self._log_line("\nStep 6: Computing date estimate...")
 
         estimate = self.date_estimator.estimate_date(
             entities=entities,
@@ -184,16 +196,14 @@ class MapDaterPipeline:
         )
 
         # Step 7: Generate explanation
-        if self.verbose:
-            print("\nStep 7: Generating explanation...")
+        self._log_line("\nStep 7: Generating explanation...")
 
         explanation = self.explanation_generator.generate_explanation(estimate)
         estimate.explanation = explanation
 
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print("ANALYSIS COMPLETE")
-            print(f"{'='*60}\n")
+        self._log_line(f"\n{'='*60}")
+        self._log_line("ANALYSIS COMPLETE")
+        self._log_line(f"{'='*60}\n")
 
         return estimate
 
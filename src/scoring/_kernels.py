@@ -0,0 +1,96 @@
+"""
+Compiled batch scoring kernel and the factor tables it shares with
+ScoreCalculator.
+
+Kept apart from score_calculator so that module can be compiled ahead of
+time with mypyc (see setup.py): numba can only JIT plain Python functions.
+"""
+
+import functools
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Factor tables: a guess width <= _WIDTH_THRESHOLDS[i] (or years off
+# <= _MISS_THRESHOLDS[i]) selects factor [i]; anything larger selects
+# the last entry
+_WIDTH_THRESHOLDS = (1, 10, 50)
+_PRECISION_FACTORS = (2.0, 1.5, 1.0, 0.5)
+_CONFIDENCE_FACTORS = (3.0, 2.0, 1.0, 0.5)
+_MISS_THRESHOLDS = (10, 50, 100)
+_MISS_FACTORS = (0.2, 0.5, 1.0, 1.5)
+_N_WIDTH_THRESHOLDS = len(_WIDTH_THRESHOLDS)
+_N_MISS_THRESHOLDS = len(_MISS_THRESHOLDS)
+
+_SCORE_KERNEL_SIGNATURE = (
+    "void(int32[:], int32[:], int32[:], int32[:], int32[:], float64[:],"
+    " float64[:], int32[:], float64[:], float64[:], float64[:], float64[:])"
+)
+
+
+if numba is not None:
+    def _score_kernel_py(
+        g_start, g_end, a_start, a_end, mly, multipliers,
+        out_overlap, out_years_off, out_base, out_bonus, out_penalty, out_final
+    ):
+        """Fused per-guess scoring loop; mirrors ScoreCalculator._score_prepared."""
+        for i in numba.prange(g_start.shape[0]):
+            gs = g_start[i]
+            ge = g_end[i]
+            guess_width = ge - gs
+
+            inter_w = min(ge, a_end[i]) - max(gs, a_start[i]) + 1
+            overlap = inter_w / (guess_width + 1) * 100.0 if inter_w > 0 else 0.0
+
+            m = mly[i]
+            if m < gs:
+                years_off = gs - m
+            elif m > ge:
+                years_off = m - ge
+            else:
+                years_off = 0
+
+            w_idx = 0
+            while w_idx < _N_WIDTH_THRESHOLDS and guess_width > _WIDTH_THRESHOLDS[w_idx]:
+                w_idx += 1
+            m_idx = 0
+            while m_idx < _N_MISS_THRESHOLDS and years_off > _MISS_THRESHOLDS[m_idx]:
+                m_idx += 1
+
+            base = overlap * 0.8
+            bonus = 0.0
+            if overlap >= 50.0:
+                bonus = min(20.0, 20.0 * _PRECISION_FACTORS[w_idx] * (overlap / 100.0))
+            penalty = 0.0
+            if overlap <= 50.0:
+                penalty = min(
+                    30.0, 30.0 * _CONFIDENCE_FACTORS[w_idx] * _MISS_FACTORS[m_idx]
+                )
+
+            final = (base + bonus - penalty) * multipliers[i]
+
+            out_overlap[i] = overlap
+            out_years_off[i] = years_off
+            out_base[i] = base
+            out_bonus[i] = bonus
+            out_penalty[i] = penalty
+            out_final[i] = max(0.0, min(100.0, final))
+
+
+@functools.lru_cache(maxsize=None)
+def get_score_kernel():
+    """
+    Return the compiled batch scoring kernel, or None without numba.
+
+    Compiled on first call rather than at import, so the interactive
+    scoring path never pays for it. No fastmath: results must match
+    ScoreCalculator exactly at the overlap == 50 boundaries.
+    """
+    if numba is None:
+        return None
+    return numba.njit(
+        _SCORE_KERNEL_SIGNATURE, cache=True, parallel=True
+    )(_score_kernel_py)
@@ -4,15 +4,23 @@ Score calculation for map dating guesses.
 Implements fair scoring that rewards accuracy and penalizes overconfidence.
 """
 
+from bisect import bisect_left
 from pathlib import Path
+from typing import Callable, ClassVar, Dict, Sequence, Tuple
 import sys
 
+import numpy as np
+
 sys.path.append(str(Path(__file__).parent.parent))
 
-from models import YearRange
 from game.game_models import (
     UserGuess, GameRound, ScoreBreakdown, DifficultyLevel
 )
+from scoring._kernels import (
+    get_score_kernel,
+    _WIDTH_THRESHOLDS, _PRECISION_FACTORS, _CONFIDENCE_FACTORS,
+    _MISS_THRESHOLDS, _MISS_FACTORS
+)
 
 
 class ScoreCalculator:
@@ -27,13 +35,20 @@ class ScoreCalculator:
     """
 
     # Difficulty multipliers
-    DIFFICULTY_MULTIPLIERS = {
+    DIFFICULTY_MULTIPLIERS: ClassVar[Dict[DifficultyLevel, float]] = {
         DifficultyLevel.BEGINNER: 1.0,
         DifficultyLevel.INTERMEDIATE: 1.25,
         DifficultyLevel.ADVANCED: 1.5,
         DifficultyLevel.GEOGRAPHIC_GOD: 2.0,
     }
 
+    # Scoring factor tables (see scoring._kernels)
+    _WIDTH_THRESHOLDS: ClassVar[Tuple[int, ...]] = _WIDTH_THRESHOLDS
+    _PRECISION_FACTORS: ClassVar[Tuple[float, ...]] = _PRECISION_FACTORS
+    _CONFIDENCE_FACTORS: ClassVar[Tuple[float, ...]] = _CONFIDENCE_FACTORS
+    _MISS_THRESHOLDS: ClassVar[Tuple[int, ...]] = _MISS_THRESHOLDS
+    _MISS_FACTORS: ClassVar[Tuple[float, ...]] = _MISS_FACTORS
+
     def __init__(self):
         """Initialize the score calculator."""
         pass
@@ -53,22 +68,67 @@ class ScoreCalculator:
         Returns:
             ScoreBreakdown with detailed scoring information
         """
+        g_start, g_end, a_start, a_end, most_likely_year = self._prepare(
+            user_guess, game_round
+        )
+        return self._score_prepared(
+            g_start, g_end, a_start, a_end, most_likely_year, game_round.difficulty
+        )
+
+    def _prepare(
+        self,
+        user_guess: UserGuess,
+        game_round: GameRound
+    ) -> Tuple[int, int, int, int, int]:
+        """
+        Extract the plain integers scoring works on.
+
+        Returns:
+            (guess start, guess end, answer start, answer end, most likely year)
+        """
         guess_range = user_guess.to_range()
         answer_range = game_round.get_answer_range()
-        most_likely_year = game_round.system_estimate.most_likely_year
+        return (
+            guess_range.start,
+            guess_range.end,
+            answer_range.start,
+            answer_range.end,
+            game_round.system_estimate.most_likely_year
+        )
+
+    def _score_prepared(
+        self,
+        g_start: int,
+        g_end: int,
+        a_start: int,
+        a_end: int,
+        most_likely_year: int,
+        difficulty: DifficultyLevel
+    ) -> ScoreBreakdown:
+        """
+        Score a guess given as plain integers.
+
+        Args:
+            g_start, g_end: User's guess range
+            a_start, a_end: System's answer range
+            most_likely_year: System's most likely year
+            difficulty: Round difficulty
 
+        Returns:
+            ScoreBreakdown with detailed scoring information
+        """
         # Calculate base metrics
-        overlap_pct = self._calculate_overlap_percentage(guess_range, answer_range)
-        years_off = self._calculate_years_off(guess_range, most_likely_year)
-        guess_width = user_guess.get_width()
+        guess_width = g_end - g_start
+        overlap_pct = self._calculate_overlap_percentage(
+            g_start, g_end, a_start, a_end, guess_width + 1
+        )
+        years_off = self._calculate_years_off(g_start, g_end, most_likely_year)
 
         # Calculate base score from overlap
         base_score = self._base_score_from_overlap(overlap_pct)
 
         # Accuracy bonus for precise correct guesses
-        accuracy_bonus = self._calculate_accuracy_bonus(
-            guess_range, answer_range, guess_width, overlap_pct
-        )
+        accuracy_bonus = self._calculate_accuracy_bonus(guess_width, overlap_pct)
 
         # Confidence penalty for narrow misses
         confidence_penalty = self._calculate_confidence_penalty(
@@ -76,7 +136,7 @@ class ScoreCalculator:
         )
 
         # Difficulty multiplier
-        difficulty_multiplier = self.DIFFICULTY_MULTIPLIERS[game_round.difficulty]
+        difficulty_multiplier = self.DIFFICULTY_MULTIPLIERS[difficulty]
 
         return ScoreBreakdown(
             base_score=base_score,
@@ -88,30 +148,171 @@ class ScoreCalculator:
             years_off=years_off
         )
 
+    def calculate_scores_batch(
+        self,
+        guess_starts: Sequence[int],
+        guess_ends: Sequence[int],
+        answer_starts: Sequence[int],
+        answer_ends: Sequence[int],
+        most_likely_years: Sequence[int],
+        difficulties: Sequence[DifficultyLevel]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score many guesses at once with vectorized NumPy arithmetic.
+
+        Produces the same numbers as calculate_score, one element per guess.
+        Intended for bulk recomputes such as leaderboards.
+
+        Args:
+            guess_starts: Start year of each guess
+            guess_ends: End year of each guess
+            answer_starts: Start year of each round's answer range
+            answer_ends: End year of each round's answer range
+            most_likely_years: Each round's most likely year
+            difficulties: Each round's difficulty level
+
+        Returns:
+            Dictionary of arrays keyed by ScoreBreakdown field name
+        """
+        g_start = np.asarray(guess_starts, dtype=np.int32)
+        g_end = np.asarray(guess_ends, dtype=np.int32)
+        a_start = np.asarray(answer_starts, dtype=np.int32)
+        a_end = np.asarray(answer_ends, dtype=np.int32)
+        mly = np.asarray(most_likely_years, dtype=np.int32)
+        multipliers = np.array(
+            [self.DIFFICULTY_MULTIPLIERS[d] for d in difficulties],
+            dtype=np.float64
+        )
+
+        score_kernel = get_score_kernel()
+        if score_kernel is not None:
+            return self._scores_batch_numba(
+                score_kernel, g_start, g_end, a_start, a_end, mly, multipliers
+            )
+        return self._scores_batch_numpy(g_start, g_end, a_start, a_end, mly, multipliers)
+
+    def _scores_batch_numba(
+        self,
+        score_kernel: Callable[..., None],
+        g_start: np.ndarray,
+        g_end: np.ndarray,
+        a_start: np.ndarray,
+        a_end: np.ndarray,
+        mly: np.ndarray,
+        multipliers: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Batch scoring via the compiled numba kernel (single fused pass)."""
+        n = g_start.shape[0]
+        overlap_pct = np.empty(n, dtype=np.float64)
+        years_off = np.empty(n, dtype=np.int32)
+        base_score = np.empty(n, dtype=np.float64)
+        accuracy_bonus = np.empty(n, dtype=np.float64)
+        confidence_penalty = np.empty(n, dtype=np.float64)
+        final_score = np.empty(n, dtype=np.float64)
+
+        score_kernel(
+            g_start, g_end, a_start, a_end, mly, multipliers,
+            overlap_pct, years_off, base_score, accuracy_bonus,
+            confidence_penalty, final_score
+        )
+
+        return {
+            'base_score': base_score,
+            'accuracy_bonus': accuracy_bonus,
+            'confidence_penalty': confidence_penalty,
+            'difficulty_multiplier': multipliers,
+            'final_score': final_score,
+            'overlap_percentage': overlap_pct,
+            'guess_width': g_end - g_start,
+            'years_off': years_off,
+        }
+
+    def _scores_batch_numpy(
+        self,
+        g_start: np.ndarray,
+        g_end: np.ndarray,
+        a_start: np.ndarray,
+        a_end: np.ndarray,
+        mly: np.ndarray,
+        multipliers: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Batch scoring with vectorized NumPy (used when numba is unavailable)."""
+        # Overlap of the guess with the answer, relative to the guess
+        inter_w = np.clip(
+            np.minimum(g_end, a_end) - np.maximum(g_start, a_start) + 1, 0, None
+        )
+        overlap_pct = inter_w / (g_end - g_start + 1) * 100
+
+        # Distance to the nearest edge (0 when the year is inside the guess)
+        years_off = np.maximum(g_start - mly, 0) + np.maximum(mly - g_end, 0)
+        guess_width = g_end - g_start
+
+        base_score = overlap_pct * 0.8
+
+        width_idx = np.searchsorted(self._WIDTH_THRESHOLDS, guess_width, side='left')
+        precision_factor = np.asarray(self._PRECISION_FACTORS)[width_idx]
+        accuracy_bonus = np.where(
+            overlap_pct < 50,
+            0.0,
+            np.minimum(20.0, 20 * precision_factor * (overlap_pct / 100))
+        )
+
+        confidence_factor = np.asarray(self._CONFIDENCE_FACTORS)[width_idx]
+        miss_idx = np.searchsorted(self._MISS_THRESHOLDS, years_off, side='left')
+        miss_factor = np.asarray(self._MISS_FACTORS)[miss_idx]
+        confidence_penalty = np.where(
+            overlap_pct > 50,
+            0.0,
+            np.minimum(30.0, 30 * confidence_factor * miss_factor)
+        )
+
+        final_score = np.clip(
+            (base_score + accuracy_bonus - confidence_penalty) * multipliers,
+            0.0,
+            100.0
+        )
+
+        return {
+            'base_score': base_score,
+            'accuracy_bonus': accuracy_bonus,
+            'confidence_penalty': confidence_penalty,
+            'difficulty_multiplier': multipliers,
+            'final_score': final_score,
+            'overlap_percentage': overlap_pct,
+            'guess_width': guess_width,
+            'years_off': years_off,
+        }
+
     def _calculate_overlap_percentage(
         self,
-        guess_range: YearRange,
-        answer_range: YearRange
+        g_start: int,
+        g_end: int,
+        a_start: int,
+        a_end: int,
+        guess_span: int
     ) -> float:
         """
         Calculate what percentage of the guess overlaps with the answer.
 
+        Args:
+            g_start, g_end: User's guess range
+            a_start, a_end: System's answer range
+            guess_span: Number of years in the guess (g_end - g_start + 1)
+
         Returns:
             Percentage (0-100) of overlap relative to guess range
         """
-        intersection = guess_range.intersection(answer_range)
+        intersection_width = min(g_end, a_end) - max(g_start, a_start) + 1
 
-        if intersection is None:
+        if intersection_width <= 0:
             return 0.0
 
-        intersection_width = intersection.end - intersection.start + 1
-        guess_width = guess_range.end - guess_range.start + 1
-
-        return (intersection_width / guess_width) * 100
+        return (intersection_width / guess_span) * 100
 
     def _calculate_years_off(
         self,
-        guess_range: YearRange,
+        g_start: int,
+        g_end: int,
         most_likely_year: int
     ) -> int:
         """
@@ -121,14 +322,14 @@ class ScoreCalculator:
             Number of years off (0 if most likely year is in guess range)
         """
         # If most likely year is in the guess range, years off is 0
-        if guess_range.start <= most_likely_year <= guess_range.end:
+        if g_start <= most_likely_year <= g_end:
             return 0
 
         # Otherwise, distance to nearest edge
-        if most_likely_year < guess_range.start:
-            return guess_range.start - most_likely_year
+        if most_likely_year < g_start:
+            return g_start - most_likely_year
         else:
-            return most_likely_year - guess_range.end
+            return most_likely_year - g_end
 
     def _base_score_from_overlap(self, overlap_pct: float) -> float:
         """
@@ -142,8 +343,6 @@ class ScoreCalculator:
 
     def _calculate_accuracy_bonus(
         self,
-        guess_range: YearRange,
-        answer_range: YearRange,
         guess_width: int,
         overlap_pct: float
     ) -> float:
@@ -155,8 +354,6 @@ class ScoreCalculator:
         - Get high overlap (showing accuracy)
 
         Args:
-            guess_range: User's guess range
-            answer_range: System's answer range
             guess_width: Width of guess in years
             overlap_pct: Overlap percentage
 
@@ -171,14 +368,9 @@ class ScoreCalculator:
         # 10-year guess → 1.5x
         # 50-year guess → 1.0x
         # 100+ year guess → 0.5x
-        if guess_width <= 1:
-            precision_factor = 2.0
-        elif guess_width <= 10:
-            precision_factor = 1.5
-        elif guess_width <= 50:
-            precision_factor = 1.0
-        else:
-            precision_factor = 0.5
+        precision_factor = self._PRECISION_FACTORS[
+            bisect_left(self._WIDTH_THRESHOLDS, guess_width)
+        ]
 
         # Overlap factor: higher overlap → more bonus
         overlap_factor = (overlap_pct / 100)
@@ -218,34 +410,52 @@ class ScoreCalculator:
         # 10-year guess → 2.0x
         # 50-year guess → 1.0x
         # 100+ year guess → 0.5x
-        if guess_width <= 1:
-            confidence_factor = 3.0
-        elif guess_width <= 10:
-            confidence_factor = 2.0
-        elif guess_width <= 50:
-            confidence_factor = 1.0
-        else:
-            confidence_factor = 0.5
+        confidence_factor = self._CONFIDENCE_FACTORS[
+            bisect_left(self._WIDTH_THRESHOLDS, guess_width)
+        ]
 
         # Miss severity: how far off
         # Within 10 years → 0.2x
         # Within 50 years → 0.5x
         # Within 100 years → 1.0x
         # More than 100 years → 1.5x
-        if years_off <= 10:
-            miss_factor = 0.2
-        elif years_off <= 50:
-            miss_factor = 0.5
-        elif years_off <= 100:
-            miss_factor = 1.0
-        else:
-            miss_factor = 1.5
+        miss_factor = self._MISS_FACTORS[
+            bisect_left(self._MISS_THRESHOLDS, years_off)
+        ]
 
         # Maximum penalty is 30 points
         penalty = 30 * confidence_factor * miss_factor
 
         return min(30.0, penalty)
 
+    def evaluate(
+        self,
+        user_guess: UserGuess,
+        game_round: GameRound
+    ) -> Tuple[bool, bool, ScoreBreakdown]:
+        """
+        Score a guess and classify it in one pass.
+
+        Equivalent to calling is_accurate, is_exact and calculate_score,
+        but extracts the guess and answer bounds only once.
+
+        Args:
+            user_guess: User's guess
+            game_round: Game round
+
+        Returns:
+            (accurate, exact, score breakdown)
+        """
+        g_start, g_end, a_start, a_end, most_likely = self._prepare(user_guess, game_round)
+
+        return (
+            self._is_accurate(g_start, g_end, a_start, a_end),
+            self._is_exact(g_start, g_end, most_likely),
+            self._score_prepared(
+                g_start, g_end, a_start, a_end, most_likely, game_round.difficulty
+            )
+        )
+
     def is_accurate(self, user_guess: UserGuess, game_round: GameRound) -> bool:
         """
         Check if the guess is considered accurate.
@@ -259,10 +469,9 @@ class ScoreCalculator:
         Returns:
             True if accurate
         """
-        guess_range = user_guess.to_range()
-        answer_range = game_round.get_answer_range()
+        g_start, g_end, a_start, a_end, _ = self._prepare(user_guess, game_round)
 
-        return guess_range.overlaps(answer_range)
+        return self._is_accurate(g_start, g_end, a_start, a_end)
 
     def is_exact(self, user_guess: UserGuess, game_round: GameRound) -> bool:
         """
@@ -277,12 +486,21 @@ class ScoreCalculator:
         Returns:
             True if exact
         """
-        guess_range = user_guess.to_range()
-        most_likely = game_round.system_estimate.most_likely_year
+        g_start, g_end, _, _, most_likely = self._prepare(user_guess, game_round)
+
+        return self._is_exact(g_start, g_end, most_likely)
+
+    @staticmethod
+    def _is_accurate(g_start: int, g_end: int, a_start: int, a_end: int) -> bool:
+        """Whether the guess range overlaps the answer range."""
+        return g_start <= a_end and a_start <= g_end
 
-        # Check if most likely year is within 5 years of guess range
+    @staticmethod
+    def _is_exact(g_start: int, g_end: int, most_likely: int) -> bool:
+        """Whether the most likely year is inside or within 5 years of the guess."""
+        # Containment first: the common case for good guesses
         return (
-            abs(guess_range.start - most_likely) <= 5 or
-            abs(guess_range.end - most_likely) <= 5 or
-            (guess_range.start <= most_likely <= guess_range.end)
+            g_start <= most_likely <= g_end or
+            abs(g_start - most_likely) <= 5 or
+            abs(g_end - most_likely) <= 5
         )
@@ -5,12 +5,15 @@ This module uses the Anthropic Claude API to analyze map images
 and extract visual features that indicate the map's creation period.
 """
 
+import asyncio
 import base64
-from typing import List, Dict, Optional, Any
+import functools
+import hashlib
+import time
+from typing import List, Dict, Optional, Any, Callable
 from pathlib import Path
 import sys
 import json
-import re
 import os
 
 try:
@@ -18,6 +21,13 @@ try:
 except ImportError:
     anthropic = None
 
+try:
+    # orjson parses large responses several times faster than stdlib json;
+    # its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 try:
     from dotenv import load_dotenv
     # Load .env file from project root
@@ -32,6 +42,51 @@ import numpy as np
 sys.path.append(str(Path(__file__).parent.parent))
 from models import ProcessedImage, VisualFeature, YearRange
 
+# Configuration defaults, read once at import (after .env is loaded).
+# Numeric values stay strings here and are converted in
+# AIVisualAnalyzer.__init__, so a malformed value cannot break importing
+# this module (and with it the whole pipeline) when AI analysis is unused.
+_DEFAULT_API_KEY = os.getenv('ANTHROPIC_API_KEY')
+_DEFAULT_MODEL = os.getenv('CLAUDE_MODEL', 'claude-3-5-sonnet-20241022')
+_DEFAULT_MAX_TOKENS = os.getenv('CLAUDE_MAX_TOKENS', '4096')
+_DEFAULT_CONCURRENCY = os.getenv('CLAUDE_CONCURRENCY', '8')
+# Claude downsamples larger images itself, so don't upload more pixels
+_DEFAULT_MAX_IMAGE_EDGE = os.getenv('CLAUDE_VISION_MAX_EDGE', '1568')
+_DEFAULT_CACHE_TTL = os.getenv('CLAUDE_CACHE_TTL', str(7 * 24 * 3600))
+# Per-user cache, so an installed package never writes next to its sources
+_DEFAULT_CACHE_DIR = os.getenv('CLAUDE_CACHE_DIR') or os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join('~', '.cache'),
+    'map-dater', 'claude'
+)
+
+_JSON_FENCE = '```json'
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> 'anthropic.Anthropic':
+    """
+    Return a shared synchronous client for an API key.
+
+    Reusing one client keeps its HTTP connection pool (and TLS sessions)
+    warm across every analyzer instance.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _extract_json_block(response_text: str) -> str:
+    """
+    Return the contents of the first ```json fenced block, or the whole text.
+
+    Two str.find scans; linear time with no regex backtracking.
+    """
+    start = response_text.find(_JSON_FENCE)
+    if start != -1:
+        start += len(_JSON_FENCE)
+        end = response_text.find('```', start)
+        if end != -1:
+            return response_text[start:end].strip()
+    return response_text
+
 
 class AIVisualAnalyzer:
     """
@@ -46,11 +101,85 @@ class AIVisualAnalyzer:
     - Border and decoration styles
     """
 
+    # Images are sent as JPEG: much faster to encode than PNG and several
+    # times smaller on the wire, with no visible loss for vision analysis
+    IMAGE_MEDIA_TYPE = "image/jpeg"
+    JPEG_QUALITY = 90
+
+    # Static part of the feature-analysis prompt (identical across calls)
+    _BASE_ANALYSIS_PROMPT = """You are a historical cartography expert analyzing a map image.
+Your task is to identify visual features that help date when this map was created.
+
+Analyze the following aspects and provide date constraints for each:
+
+1. **Printing Technique**:
+   - Hand-drawn (pre-1800s typically)
+   - Lithography (1800s-1950s)
+   - Offset printing (1900s-1980s)
+   - Digital printing (1980s+)
+
+2. **Typography & Fonts**:
+   - Hand-lettering style
+   - Mechanical typesetting
+   - Digital fonts
+   - Font characteristics that indicate era
+
+3. **Color Palette**:
+   - Black and white vs color
+   - Number of colors (process limitations by era)
+   - Color registration quality
+   - Digital vs analog color characteristics
+
+4. **Border & Decoration Style**:
+   - Ornate decorative borders (common pre-1900)
+   - Simple mechanical borders (1900-1950)
+   - Minimal modern borders (1950+)
+
+5. **Cartographic Style**:
+   - Projection type and accuracy
+   - Level of geographic detail
+   - Symbology conventions
+
+6. **Infrastructure & Features**:
+   - Railroads (expansion patterns)
+   - Highway systems
+   - Airports
+   - Other temporal markers
+
+For each feature you identify, provide:
+- Feature type (typography, border_style, color_palette, printing_technique, infrastructure, etc.)
+- Description of what you observe
+- Estimated year range (start_year to end_year)
+- Confidence level (0.0 to 1.0)
+- Reasoning for your assessment
+
+Format your response as JSON:
+```json
+{
+  "features": [
+    {
+      "feature_type": "typography",
+      "description": "Digital sans-serif font, likely Arial or Helvetica",
+      "year_range": {"start": 1985, "end": 2025},
+      "confidence": 0.85,
+      "reasoning": "Digital fonts became common after desktop publishing emerged in mid-1980s"
+    },
+    ...
+  ]
+}
+```
+
+Be specific and technical in your observations. Focus on evidence-based dating."""
+
+    # Cache directory for API responses (CLAUDE_CACHE_DIR overrides it)
+    CACHE_DIR = Path(_DEFAULT_CACHE_DIR).expanduser()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True
     ):
         """
         Initialize the AI visual analyzer.
@@ -59,6 +188,8 @@ class AIVisualAnalyzer:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY from .env)
             model: Claude model to use (defaults to CLAUDE_MODEL from .env or claude-3-5-sonnet-20241022)
             max_tokens: Maximum tokens for response (defaults to CLAUDE_MAX_TOKENS from .env or 4096)
+            use_cache: Whether to cache API responses in CACHE_DIR, keyed by
+                       image, prompt and model (expiry: CLAUDE_CACHE_TTL seconds)
         """
         if anthropic is None:
             raise ImportError(
@@ -68,7 +199,7 @@ class AIVisualAnalyzer:
 
         # Load configuration from .env if not provided
         if api_key is None:
-            api_key = os.getenv('ANTHROPIC_API_KEY')
+            api_key = _DEFAULT_API_KEY
             if not api_key:
                 raise ValueError(
                     "ANTHROPIC_API_KEY not found. "
@@ -77,38 +208,244 @@ class AIVisualAnalyzer:
                 )
 
         if model is None:
-            model = os.getenv('CLAUDE_MODEL', 'claude-3-5-sonnet-20241022')
+            model = _DEFAULT_MODEL
 
         if max_tokens is None:
-            max_tokens = int(os.getenv('CLAUDE_MAX_TOKENS', '4096'))
+            max_tokens = int(_DEFAULT_MAX_TOKENS)
 
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _get_client(api_key)
+        self.api_key = api_key
+        self.concurrency = int(_DEFAULT_CONCURRENCY)
+        self.max_image_edge = int(_DEFAULT_MAX_IMAGE_EDGE)
         self.model = model
         self.max_tokens = max_tokens
 
+        self.use_cache = use_cache
+        self.cache_ttl = int(_DEFAULT_CACHE_TTL)
+        if use_cache:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    def precompute_encoding(self, processed_image: ProcessedImage) -> None:
+        """
+        Encode an image ahead of time so later API calls reuse the result.
+
+        Useful in batch pipelines to warm the encoding cache before dispatch.
+
+        Args:
+            processed_image: Processed map image
+        """
+        self._encode_image(processed_image)
+
+    def _encoding_key(self, processed_image: ProcessedImage) -> tuple:
+        """
+        Key for an encoding of this image under the current encoder settings.
+
+        Keyed on the pixel content (shape, dtype and a hash of the buffer),
+        so editing image_data in place or replacing it invalidates the entry.
+        Hashing is a small fraction of the cost of JPEG encoding.
+        """
+        img = processed_image.image_data
+        digest = hashlib.blake2b(np.ascontiguousarray(img).data, digest_size=16).digest()
+        return ('jpeg', self.JPEG_QUALITY, self.max_image_edge, img.shape, img.dtype.str, digest)
+
     def _encode_image(self, processed_image: ProcessedImage) -> str:
         """
         Encode image as base64 for API.
 
+        The result is cached on the ProcessedImage, so calling several
+        analysis methods on the same image only encodes it once.
+
         Args:
             processed_image: Processed map image
 
         Returns:
             Base64 encoded image string
         """
+        max_edge = self.max_image_edge
+        cache_key = self._encoding_key(processed_image)
+        cached = processed_image.encoded_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         import cv2
 
-        # Convert to PNG bytes
-        _, buffer = cv2.imencode('.png', processed_image.image_data)
-        image_bytes = buffer.tobytes()
+        # Downscale oversized scans before encoding
+        img = processed_image.image_data
+        h, w = img.shape[:2]
+        scale = min(1.0, max_edge / max(h, w))
+        if scale < 1.0:
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        # Convert to JPEG bytes
+        _, buffer = cv2.imencode(
+            '.jpg',
+            img,
+            [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+        )
+
+        # Encode to base64 straight from the encoder buffer (no bytes copy);
+        # base64 output is pure ASCII
+        encoded = base64.b64encode(memoryview(buffer)).decode('ascii')
+        processed_image.encoded_cache[cache_key] = encoded
+        return encoded
+
+    def _build_messages(self, image_b64: str, text: str) -> List[Dict[str, Any]]:
+        """
+        Build the single-turn image + text message list for the API.
+
+        Args:
+            image_b64: Base64 encoded image
+            text: Prompt or question to send with the image
+
+        Returns:
+            Messages payload for messages.create
+        """
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": self.IMAGE_MEDIA_TYPE,
+                            "data": image_b64,
+                        },
+                    },
+                    {
+                        "type": "text",
+                        "text": text
+                    }
+                ],
+            }
+        ]
+
+    def _request(
+        self,
+        image_b64: str,
+        text: str,
+        max_tokens: int,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Send an image + text request and return the response text.
+
+        The response is streamed, so on_text sees output as it is generated
+        rather than after the whole reply is complete. Served from the
+        on-disk cache when an identical request was made recently.
+
+        Args:
+            image_b64: Base64 encoded image
+            text: Prompt or question
+            max_tokens: Maximum tokens for the response
+            on_text: Optional callback receiving response text chunks
+
+        Returns:
+            Response text
+        """
+        cache_key = self._get_cache_key(image_b64, text, max_tokens)
+        if self.use_cache:
+            cached = self._load_from_cache(cache_key)
+            if cached is not None:
+                if on_text is not None:
+                    on_text(cached)
+                return cached
+
+        chunks = []
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=self._build_messages(image_b64, text),
+        ) as stream:
+            for chunk in stream.text_stream:
+                chunks.append(chunk)
+                if on_text is not None:
+                    on_text(chunk)
+            stop_reason = stream.get_final_message().stop_reason
+        response_text = ''.join(chunks)
+
+        # Truncated replies (e.g. stop_reason "max_tokens") are not cached,
+        # so a retry calls the API again instead of replaying them
+        if self.use_cache and stop_reason == "end_turn":
+            self._save_to_cache(cache_key, response_text)
+
+        return response_text
+
+    async def _arequest(
+        self,
+        client: 'anthropic.AsyncAnthropic',
+        image_b64: str,
+        text: str,
+        max_tokens: int
+    ) -> str:
+        """Async counterpart of _request using the given async client."""
+        cache_key = self._get_cache_key(image_b64, text, max_tokens)
+        if self.use_cache:
+            cached = self._load_from_cache(cache_key)
+            if cached is not None:
+                return cached
+
+        message = await client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=self._build_messages(image_b64, text),
+        )
+        response_text = message.content[0].text
+
+        if self.use_cache and message.stop_reason == "end_turn":
+            self._save_to_cache(cache_key, response_text)
 
-        # Encode to base64
-        return base64.b64encode(image_bytes).decode('utf-8')
+        return response_text
+
+    def _get_cache_key(self, image_b64: str, text: str, max_tokens: int) -> str:
+        """Content hash identifying a request (image, prompt, model, limits)."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{self.model}\0{max_tokens}\0".encode('utf-8'))
+        h.update(hashlib.sha256(text.encode('utf-8')).digest())
+        h.update(image_b64.encode('ascii'))
+        return h.hexdigest()
+
+    def _get_cache_path(self, cache_key: str) -> Path:
+        """Get the cache file path for a request key."""
+        return self.CACHE_DIR / f"{cache_key}.json"
+
+    def _load_from_cache(self, cache_key: str) -> Optional[str]:
+        """Load a cached response if present and not expired."""
+        cache_path = self._get_cache_path(cache_key)
+
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)["response"]
+        except Exception:
+            return None
+
+    def _save_to_cache(self, cache_key: str, response_text: str) -> None:
+        """Save a response to the cache."""
+        try:
+            with open(self._get_cache_path(cache_key), 'w', encoding='utf-8') as f:
+                json.dump({"model": self.model, "response": response_text}, f)
+        except Exception:
+            pass  # Silently fail cache writes
+
+    def clear_cache(self) -> int:
+        """Clear all cached responses. Returns number of files deleted."""
+        count = 0
+        if self.CACHE_DIR.exists():
+            for f in self.CACHE_DIR.glob("*.json"):
+                try:
+                    f.unlink()
+                    count += 1
+                except OSError:
+                    pass
+        return count
 
     def analyze_map_features(
         self,
         processed_image: ProcessedImage,
-        focus_areas: Optional[List[str]] = None
+        focus_areas: Optional[List[str]] = None,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> List[VisualFeature]:
         """
         Analyze visual features using AI vision.
@@ -117,6 +454,7 @@ class AIVisualAnalyzer:
             processed_image: Preprocessed map image
             focus_areas: Optional list of specific features to analyze
                         (e.g., ['typography', 'borders', 'colors'])
+            on_text: Optional callback receiving raw response text as it streams
 
         Returns:
             List of extracted visual features with date constraints
@@ -129,32 +467,11 @@ class AIVisualAnalyzer:
 
         # Call Claude API
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_b64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
+            response_text = self._request(
+                image_b64, prompt, self.max_tokens, on_text=on_text
             )
 
             # Parse response
-            response_text = message.content[0].text
             features = self._parse_response(response_text)
 
             return features
@@ -163,84 +480,111 @@ class AIVisualAnalyzer:
             print(f"Warning: AI analysis failed: {e}")
             return []
 
-    def _build_analysis_prompt(self, focus_areas: Optional[List[str]] = None) -> str:
+    async def _analyze_map_features_async(
+        self,
+        client: 'anthropic.AsyncAnthropic',
+        processed_image: ProcessedImage,
+        prompt: str,
+        semaphore: asyncio.Semaphore
+    ) -> List[VisualFeature]:
         """
-        Build the analysis prompt for Claude.
+        Analyze one image with the async client, bounded by a semaphore.
 
         Args:
-            focus_areas: Optional specific areas to focus on
+            client: Async client for the current event loop
+            processed_image: Preprocessed map image
+            prompt: Analysis prompt
+            semaphore: Limits the number of in-flight requests
 
         Returns:
-            Formatted prompt string
+            List of extracted visual features (empty on failure)
         """
-        base_prompt = """You are a historical cartography expert analyzing a map image.
-Your task is to identify visual features that help date when this map was created.
+        image_b64 = self._encode_image(processed_image)
 
-Analyze the following aspects and provide date constraints for each:
+        async with semaphore:
+            try:
+                response_text = await self._arequest(
+                    client, image_b64, prompt, self.max_tokens
+                )
+            except Exception as e:
+                print(f"Warning: AI analysis failed for {processed_image.original_path}: {e}")
+                return []
 
-1. **Printing Technique**:
-   - Hand-drawn (pre-1800s typically)
-   - Lithography (1800s-1950s)
-   - Offset printing (1900s-1980s)
-   - Digital printing (1980s+)
+        # A malformed reply (e.g. an inverted year range) must not fail the
+        # whole gather; treat it like the sync path does
+        try:
+            return self._parse_response(response_text)
+        except Exception as e:
+            print(f"Warning: AI analysis failed for {processed_image.original_path}: {e}")
+            return []
 
-2. **Typography & Fonts**:
-   - Hand-lettering style
-   - Mechanical typesetting
-   - Digital fonts
-   - Font characteristics that indicate era
+    async def analyze_batch(
+        self,
+        processed_images: List[ProcessedImage],
+        focus_areas: Optional[List[str]] = None
+    ) -> List[List[VisualFeature]]:
+        """
+        Analyze several maps concurrently.
 
-3. **Color Palette**:
-   - Black and white vs color
-   - Number of colors (process limitations by era)
-   - Color registration quality
-   - Digital vs analog color characteristics
+        Requests are issued in parallel, at most CLAUDE_CONCURRENCY
+        (default 8) at a time, so total wall time is roughly the slowest
+        request per batch instead of the sum of all requests.
 
-4. **Border & Decoration Style**:
-   - Ornate decorative borders (common pre-1900)
-   - Simple mechanical borders (1900-1950)
-   - Minimal modern borders (1950+)
+        Args:
+            processed_images: Preprocessed map images
+            focus_areas: Optional list of specific features to analyze
 
-5. **Cartographic Style**:
-   - Projection type and accuracy
-   - Level of geographic detail
-   - Symbology conventions
+        Returns:
+            One list of visual features per input image, in input order
+        """
+        prompt = self._build_analysis_prompt(focus_areas)
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-6. **Infrastructure & Features**:
-   - Railroads (expansion patterns)
-   - Highway systems
-   - Airports
-   - Other temporal markers
+        # Async clients are bound to the event loop they first run on, so
+        # one is created per batch and shared by all of its requests
+        async with anthropic.AsyncAnthropic(api_key=self.api_key) as client:
+            return await asyncio.gather(*(
+                self._analyze_map_features_async(client, image, prompt, semaphore)
+                for image in processed_images
+            ))
 
-For each feature you identify, provide:
-- Feature type (typography, border_style, color_palette, printing_technique, infrastructure, etc.)
-- Description of what you observe
-- Estimated year range (start_year to end_year)
-- Confidence level (0.0 to 1.0)
-- Reasoning for your assessment
+    def analyze_map_features_batch(
+        self,
+        processed_images: List[ProcessedImage],
+        focus_areas: Optional[List[str]] = None
+    ) -> List[List[VisualFeature]]:
+        """
+        Synchronous wrapper around analyze_batch.
 
-Format your response as JSON:
-```json
-{
-  "features": [
-    {
-      "feature_type": "typography",
-      "description": "Digital sans-serif font, likely Arial or Helvetica",
-      "year_range": {"start": 1985, "end": 2025},
-      "confidence": 0.85,
-      "reasoning": "Digital fonts became common after desktop publishing emerged in mid-1980s"
-    },
-    ...
-  ]
-}
-```
+        Must not be called from inside a running event loop; use
+        ``await analyze_batch(...)`` there instead.
 
-Be specific and technical in your observations. Focus on evidence-based dating."""
+        Args:
+            processed_images: Preprocessed map images
+            focus_areas: Optional list of specific features to analyze
 
-        if focus_areas:
-            base_prompt += f"\n\nFocus particularly on these areas: {', '.join(focus_areas)}"
+        Returns:
+            One list of visual features per input image, in input order
+        """
+        return asyncio.run(self.analyze_batch(processed_images, focus_areas))
+
+    def _build_analysis_prompt(self, focus_areas: Optional[List[str]] = None) -> str:
+        """
+        Build the analysis prompt for Claude.
 
-        return base_prompt
+        Args:
+            focus_areas: Optional specific areas to focus on
+
+        Returns:
+            Formatted prompt string
+        """
+        if not focus_areas:
+            return self._BASE_ANALYSIS_PROMPT
+
+        return (
+            f"{self._BASE_ANALYSIS_PROMPT}\n\n"
+            f"Focus particularly on these areas: {', '.join(focus_areas)}"
+        )
 
     def _parse_response(self, response_text: str) -> List[VisualFeature]:
         """
@@ -255,15 +599,11 @@ Be specific and technical in your observations. Focus on evidence-based dating."
         features = []
 
         try:
-            # Extract JSON from response (might be wrapped in markdown)
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # Try to parse entire response as JSON
-                json_str = response_text
+            # Extract JSON from response (might be wrapped in markdown,
+            # otherwise the entire response is parsed as JSON)
+            json_str = _extract_json_block(response_text)
 
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
 
             for feature_data in data.get('features', []):
                 year_range = None
@@ -297,7 +637,8 @@ Be specific and technical in your observations. Focus on evidence-based dating."
         self,
         processed_image: ProcessedImage,
         x: int, y: int, width: int, height: int,
-        question: str
+        question: str,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Analyze a specific region of the map with a custom question.
@@ -308,61 +649,46 @@ Be specific and technical in your observations. Focus on evidence-based dating."
             processed_image: Preprocessed map image
             x, y, width, height: Region coordinates
             question: Specific question to ask about this region
+            on_text: Optional callback receiving response text as it streams
 
         Returns:
             AI's analysis response
         """
-        # Crop to region
-        import cv2
-        region = processed_image.image_data[y:y+height, x:x+width]
-
-        # Create temporary ProcessedImage for region
-        from models import ProcessedImage as PI
-        region_image = PI(
-            image_data=region,
-            original_path=processed_image.original_path,
-            width=width,
-            height=height,
-            preprocessing_applied=processed_image.preprocessing_applied
-        )
+        # Region encodings are cached on the parent image, so asking several
+        # questions about the same region only crops and encodes it once
+        region_key = self._encoding_key(processed_image) + ('region', x, y, width, height)
+        image_b64 = processed_image.encoded_cache.get(region_key)
+
+        if image_b64 is None:
+            # Crop to region (contiguous copy, as the encoder needs one anyway)
+            region = np.ascontiguousarray(
+                processed_image.image_data[y:y+height, x:x+width]
+            )
+
+            # Create temporary ProcessedImage for region
+            region_image = ProcessedImage(
+                image_data=region,
+                original_path=processed_image.original_path,
+                width=width,
+                height=height,
+                preprocessing_applied=processed_image.preprocessing_applied
+            )
 
-        # Encode
-        image_b64 = self._encode_image(region_image)
+            # Encode
+            image_b64 = self._encode_image(region_image)
+            processed_image.encoded_cache[region_key] = image_b64
 
         # Query
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_b64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": question
-                            }
-                        ],
-                    }
-                ],
-            )
-
-            return message.content[0].text
+            return self._request(image_b64, question, self.max_tokens, on_text=on_text)
 
         except Exception as e:
             return f"Error: {e}"
 
     def get_quick_dating_estimate(
         self,
-        processed_image: ProcessedImage
+        processed_image: ProcessedImage,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Get a quick date estimate from AI without detailed feature extraction.
@@ -371,6 +697,7 @@ Be specific and technical in your observations. Focus on evidence-based dating."
 
         Args:
             processed_image: Preprocessed map image
+            on_text: Optional callback receiving raw response text as it streams
 
         Returns:
             Dictionary with estimated date range and confidence
@@ -397,38 +724,10 @@ Respond in JSON format:
 ```"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": image_b64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
-
-            response_text = message.content[0].text
+            response_text = self._request(image_b64, prompt, 1024, on_text=on_text)
 
             # Parse JSON
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-            else:
-                return json.loads(response_text)
+            return _json_loads(_extract_json_block(response_text))
 
         except Exception as e:
             return {
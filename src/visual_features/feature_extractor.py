@@ -13,14 +13,88 @@ Future extensions:
 - Coastline accuracy (improves over time)
 """
 
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 from models import ProcessedImage, VisualFeature, YearRange
 
 
+# Stub features are image-independent, so they are built once at import
+# and every _extract_* call returns the same shared instance. They are
+# frozen; treat their metadata dicts as read-only too.
+_BORDER_STUB = VisualFeature(
+    feature_type='border_style',
+    description='Border style analysis (stub)',
+    confidence=0.3,
+    year_range=None,  # Not confident enough to constrain
+    metadata={
+        'status': 'stub',
+        'future_ml_model': 'border_style_classifier.pkl'
+    }
+)
+
+_COLOR_STUB = VisualFeature(
+    feature_type='color_palette',
+    description='Color palette analysis (stub)',
+    confidence=0.2,
+    year_range=None,
+    metadata={
+        'status': 'stub',
+        'future_ml_model': 'color_palette_analyzer.pkl'
+    }
+)
+
+_TYPOGRAPHY_STUB = VisualFeature(
+    feature_type='typography',
+    description='Typography analysis (stub)',
+    confidence=0.2,
+    year_range=None,
+    metadata={
+        'status': 'stub',
+        'future_ml_model': 'typography_classifier.pkl',
+        'note': 'Font styles are strong dating indicators'
+    }
+)
+
+_PROJECTION_STUB = VisualFeature(
+    feature_type='projection',
+    description='Projection detection (stub)',
+    confidence=0.1,
+    year_range=None,
+    metadata={
+        'status': 'stub',
+        'future_ml_model': 'projection_detector.pkl'
+    }
+)
+
+_INFRASTRUCTURE_STUB = VisualFeature(
+    feature_type='infrastructure',
+    description='Infrastructure detection (stub)',
+    confidence=0.1,
+    year_range=None,
+    metadata={
+        'status': 'stub',
+        'future_ml_model': 'infrastructure_detector.pkl',
+        'note': 'Railroads, highways, airports are strong temporal markers'
+    }
+)
+
+_ALL_STUBS = (
+    _BORDER_STUB,
+    _COLOR_STUB,
+    _TYPOGRAPHY_STUB,
+    _PROJECTION_STUB,
+    _INFRASTRUCTURE_STUB,
+)
+
+_FEATURE_TYPES = tuple(f.feature_type for f in _ALL_STUBS)
+
+
 class VisualFeatureExtractor:
     """
     Extracts visual features from map images.
@@ -30,7 +104,7 @@ class VisualFeatureExtractor:
     FUTURE EXTENSION POINTS:
     - Replace _extract_* methods with actual ML models
     - Add new feature types as new methods
-    - Each method should return List[VisualFeature]
+    - Each method should return a tuple of VisualFeature
     """
 
     def __init__(self, enable_ml_features: bool = False):
@@ -57,23 +131,21 @@ class VisualFeatureExtractor:
             processed_image: Preprocessed map image
 
         Returns:
-            List of visual features (currently mocked)
+            List of visual features (currently mocked). The features are
+            shared stub instances; do not modify their metadata.
         """
-        features = []
-
-        # Extract different feature types
-        features.extend(self._extract_border_style(processed_image))
-        features.extend(self._extract_color_palette(processed_image))
-        features.extend(self._extract_typography(processed_image))
-        features.extend(self._extract_projection_hints(processed_image))
-        features.extend(self._extract_infrastructure(processed_image))
-
-        return features
+        return list(chain(
+            self._extract_border_style(processed_image),
+            self._extract_color_palette(processed_image),
+            self._extract_typography(processed_image),
+            self._extract_projection_hints(processed_image),
+            self._extract_infrastructure(processed_image),
+        ))
 
     def _extract_border_style(
         self,
         processed_image: ProcessedImage
-    ) -> List[VisualFeature]:
+    ) -> Tuple[VisualFeature, ...]:
         """
         Analyze border drawing style.
 
@@ -85,24 +157,12 @@ class VisualFeatureExtractor:
 
         CURRENT: Returns mock feature
         """
-        # Stub: Return a low-confidence mock feature
-        return [
-            VisualFeature(
-                feature_type='border_style',
-                description='Border style analysis (stub)',
-                confidence=0.3,
-                year_range=None,  # Not confident enough to constrain
-                metadata={
-                    'status': 'stub',
-                    'future_ml_model': 'border_style_classifier.pkl'
-                }
-            )
-        ]
+        return (_BORDER_STUB,)
 
     def _extract_color_palette(
         self,
         processed_image: ProcessedImage
-    ) -> List[VisualFeature]:
+    ) -> Tuple[VisualFeature, ...]:
         """
         Analyze color palette and printing technique.
 
@@ -114,23 +174,12 @@ class VisualFeatureExtractor:
 
         CURRENT: Returns mock feature
         """
-        return [
-            VisualFeature(
-                feature_type='color_palette',
-                description='Color palette analysis (stub)',
-                confidence=0.2,
-                year_range=None,
-                metadata={
-                    'status': 'stub',
-                    'future_ml_model': 'color_palette_analyzer.pkl'
-                }
-            )
-        ]
+        return (_COLOR_STUB,)
 
     def _extract_typography(
         self,
         processed_image: ProcessedImage
-    ) -> List[VisualFeature]:
+    ) -> Tuple[VisualFeature, ...]:
         """
         Analyze typography and font styles.
 
@@ -141,24 +190,12 @@ class VisualFeatureExtractor:
 
         CURRENT: Returns mock feature
         """
-        return [
-            VisualFeature(
-                feature_type='typography',
-                description='Typography analysis (stub)',
-                confidence=0.2,
-                year_range=None,
-                metadata={
-                    'status': 'stub',
-                    'future_ml_model': 'typography_classifier.pkl',
-                    'note': 'Font styles are strong dating indicators'
-                }
-            )
-        ]
+        return (_TYPOGRAPHY_STUB,)
 
     def _extract_projection_hints(
         self,
         processed_image: ProcessedImage
-    ) -> List[VisualFeature]:
+    ) -> Tuple[VisualFeature, ...]:
         """
         Detect cartographic projection type.
 
@@ -169,23 +206,12 @@ class VisualFeatureExtractor:
 
         CURRENT: Returns mock feature
         """
-        return [
-            VisualFeature(
-                feature_type='projection',
-                description='Projection detection (stub)',
-                confidence=0.1,
-                year_range=None,
-                metadata={
-                    'status': 'stub',
-                    'future_ml_model': 'projection_detector.pkl'
-                }
-            )
-        ]
+        return (_PROJECTION_STUB,)
 
     def _extract_infrastructure(
         self,
         processed_image: ProcessedImage
-    ) -> List[VisualFeature]:
+    ) -> Tuple[VisualFeature, ...]:
         """
         Detect infrastructure features (railroads, highways, etc.).
 
@@ -197,55 +223,37 @@ class VisualFeatureExtractor:
 
         CURRENT: Returns mock feature
         """
-        return [
-            VisualFeature(
-                feature_type='infrastructure',
-                description='Infrastructure detection (stub)',
-                confidence=0.1,
-                year_range=None,
-                metadata={
-                    'status': 'stub',
-                    'future_ml_model': 'infrastructure_detector.pkl',
-                    'note': 'Railroads, highways, airports are strong temporal markers'
-                }
-            )
-        ]
+        return (_INFRASTRUCTURE_STUB,)
 
     def extract_specific_features(
         self,
         processed_image: ProcessedImage,
-        feature_types: List[str]
+        feature_types: Iterable[str]
     ) -> List[VisualFeature]:
         """
         Extract only specific feature types.
 
         Args:
             processed_image: Preprocessed image
-            feature_types: List of feature types to extract
+            feature_types: Feature types to extract
 
         Returns:
             Filtered list of visual features
         """
-        all_features = self.extract_all_features(processed_image)
+        wanted = frozenset(feature_types)
         return [
-            f for f in all_features
-            if f.feature_type in feature_types
+            f for f in self.extract_all_features(processed_image)
+            if f.feature_type in wanted
         ]
 
     def get_available_feature_types(self) -> List[str]:
         """
-        Get list of all feature types this extractor can produce.
+        Get all feature types this extractor can produce.
 
         Returns:
-            List of feature type names
+            List of feature type names (a new list; safe to modify)
         """
-        return [
-            'border_style',
-            'color_palette',
-            'typography',
-            'projection',
-            'infrastructure'
-        ]
+        return list(_FEATURE_TYPES)
 
     def get_extension_guide(self) -> Dict[str, str]:
         """
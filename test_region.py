@@ -1,32 +1,41 @@
 """Test script for region zoom."""
+import io
 import json
 import base64
 import re
 import urllib.request
 
+import numpy as np
+
+# Start point of each SVG path; bytes because fromregex reads binary files
+_PATH_RE = re.compile(rb'd="M ([\d\.\-]+) ([\d\.\-]+)')
+
 def test_region(region):
     url = f"http://localhost:8000/game/start?difficulty=beginner&region={region}"
     req = urllib.request.Request(url, method='POST')
     with urllib.request.urlopen(req) as response:
-        data = json.loads(response.read().decode('utf-8'))
+        data = json.load(response)
 
-    svg = base64.b64decode(data['map_image']).decode('utf-8')
+    svg_bytes = base64.b64decode(data['map_image'])
 
-    # Find path coordinates
-    paths = re.findall(r'd="M ([\d\.\-]+) ([\d\.\-]+)', svg)
+    # Find path start coordinates (no need to decode the SVG text)
+    paths = np.fromregex(
+        io.BytesIO(svg_bytes),
+        _PATH_RE,
+        dtype=[('x', 'f4'), ('y', 'f4')]
+    )
 
     print(f"\n=== {region.upper()} ===")
     print(f"Total paths: {len(paths)}")
-    if paths:
+    if len(paths):
         # Get first few x,y coordinates
         for i, (x, y) in enumerate(paths[:5]):
             print(f"  Path {i+1}: x={x}, y={y}")
 
         # Find coordinate ranges
-        xs = [float(p[0]) for p in paths]
-        ys = [float(p[1]) for p in paths]
-        print(f"X range: {min(xs):.1f} - {max(xs):.1f}")
-        print(f"Y range: {min(ys):.1f} - {max(ys):.1f}")
+        xs, ys = paths['x'], paths['y']
+        print(f"X range: {xs.min():.1f} - {xs.max():.1f}")
+        print(f"Y range: {ys.min():.1f} - {ys.max():.1f}")
 
 if __name__ == "__main__":
     test_region("world")
@@ -1,10 +1,16 @@
 """Test region zoom and SVG clipping."""
+import re
 import sys
 sys.path.insert(0, 'src')
 
 from map_generation.generation_pipeline import generate_map_from_date
 from map_generation.map_renderer import REGION_VIEWPORTS
 
+# SVG markers checked below, one named group each
+_MARKER_RE = re.compile(
+    rb'(?P<clip_def>clipPath)|(?P<clip_attr>clip-path=)|(?P<group_end></g>)'
+)
+
 # Test Europe region map generation
 print("Testing Europe region zoom...")
 result = generate_map_from_date('1950', output_format='svg', hide_date_in_title=True, region='europe')
@@ -12,25 +18,31 @@ print(f'Image generated: {result.image_data is not None}')
 print(f'Image length: {len(result.image_data) if result.image_data else 0}')
 
 # Check SVG content (it's bytes, not base64)
-svg_content = result.image_data.decode('utf-8')
-print(f'\nHas clipPath: {"clipPath" in svg_content}')
-print(f'Has clip-path attribute: {"clip-path=" in svg_content}')
-print(f'Has closing g tag: {"</g>" in svg_content}')
+svg_bytes = result.image_data
+# One scan for all markers, stopping once each has been seen
+found = set()
+for match in _MARKER_RE.finditer(svg_bytes):
+    found.add(match.lastgroup)
+    if len(found) == _MARKER_RE.groups:
+        break
+print(f'\nHas clipPath: {"clip_def" in found}')
+print(f'Has clip-path attribute: {"clip_attr" in found}')
+print(f'Has closing g tag: {"group_end" in found}')
 
 # Check viewport being used
 print(f'\nEurope viewport: {REGION_VIEWPORTS["europe"]}')
 
 # Save SVG for manual inspection
-with open('test_europe_map.svg', 'w', encoding='utf-8') as f:
-    f.write(svg_content)
+with open('test_europe_map.svg', 'wb') as f:
+    f.write(svg_bytes)
 print("\nSaved test_europe_map.svg for inspection")
 
-# Print first few and last few lines of SVG
-lines = svg_content.split('\n')
+# Print first few and last few lines of SVG (only these are decoded)
+lines = svg_bytes.splitlines()
 print("\nFirst 30 lines of SVG:")
 for line in lines[:30]:
-    print(line)
+    print(line.decode('utf-8'))
 print("\n... middle content ...")
 print("\nLast 15 lines of SVG:")
 for line in lines[-15:]:
-    print(line)
+    print(line.decode('utf-8'))
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the src modules importable from every test module
+_SRC_DIR = str(Path(__file__).parent.parent / 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
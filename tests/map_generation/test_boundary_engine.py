@@ -2,12 +2,8 @@
 Tests for the boundary engine module.
 """
 
+import copy
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from models import YearRange
 from map_generation.date_parser import DateParser
@@ -21,53 +17,61 @@ from map_generation.boundary_engine import (
 )
 
 
-class TestBoundaryEngine:
-    """Tests for BoundaryEngine class."""
+@pytest.fixture(scope="class")
+def engine():
+    """Boundary engine shared by a test class (tests only read from it)."""
+    return BoundaryEngine()
+
+
+@pytest.fixture(scope="class")
+def parser():
+    """Date parser shared by a test class."""
+    return DateParser()
+
+
+@pytest.fixture(scope="class")
+def resolver():
+    """State resolver shared by a test class."""
+    return HistoricalStateResolver()
+
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.engine = BoundaryEngine()
-        self.parser = DateParser()
-        self.resolver = HistoricalStateResolver()
+def _get_resolved_state(parser, resolver, date_str: str):
+    """Helper to get resolved state for a date."""
+    parsed = parser.parse(date_str)
+    return resolver.resolve(parsed)
 
-    def _get_resolved_state(self, date_str: str):
-        """Helper to get resolved state for a date."""
-        parsed = self.parser.parse(date_str)
-        return self.resolver.resolve(parsed)
+
+@pytest.fixture(scope="class")
+def boundaries_1970(engine, parser, resolver):
+    """1970 boundaries, generated once per class (tests only read them)."""
+    return engine.generate_boundaries(_get_resolved_state(parser, resolver, "1970"))
+
+
+@pytest.mark.xdist_group("boundary_engine")
+class TestBoundaryEngine:
+    """Tests for BoundaryEngine class."""
 
     # --- Basic Generation Tests ---
 
-    def test_generate_boundaries(self):
+    def test_generate_boundaries(self, boundaries_1970):
         """Test basic boundary generation."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        assert isinstance(boundaries, BoundarySet)
-        assert len(boundaries.polygons) > 0
+        assert isinstance(boundaries_1970, BoundarySet)
+        assert len(boundaries_1970.polygons) > 0
 
-    def test_boundary_set_has_date_range(self):
+    def test_boundary_set_has_date_range(self, boundaries_1970):
         """Test that boundary set has date range."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
+        assert boundaries_1970.date_range.start == 1970
+        assert boundaries_1970.date_range.end == 1970
 
-        assert boundaries.date_range.start == 1970
-        assert boundaries.date_range.end == 1970
-
-    def test_boundary_set_has_notes(self):
+    def test_boundary_set_has_notes(self, boundaries_1970):
         """Test that boundary set has generation notes."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        assert len(boundaries.notes) > 0
+        assert len(boundaries_1970.notes) > 0
 
     # --- Polygon Tests ---
 
-    def test_polygons_have_required_attributes(self):
+    def test_polygons_have_required_attributes(self, boundaries_1970):
         """Test that polygons have all required attributes."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        for polygon in boundaries.polygons:
+        for polygon in boundaries_1970.polygons:
             assert polygon.entity_name is not None
             assert polygon.entity_type is not None
             assert polygon.fill_color is not None
@@ -91,6 +95,16 @@ class TestBoundaryEngine:
         assert centroid.x == 5.0
         assert centroid.y == 5.0
 
+    def test_polygon_centroid_is_cached(self):
+        """Test that the centroid is computed once per polygon."""
+        polygon = Polygon(
+            points=[Point(0, 0), Point(10, 0), Point(10, 10), Point(0, 10)],
+            entity_name="Test",
+            entity_type="country"
+        )
+
+        assert polygon.centroid is polygon.centroid
+
     def test_polygon_label_position(self):
         """Test polygon label position."""
         polygon = Polygon(
@@ -118,29 +132,23 @@ class TestBoundaryEngine:
 
     # --- Entity Type Filtering ---
 
-    def test_country_polygons_filter(self):
+    def test_country_polygons_filter(self, boundaries_1970):
         """Test filtering for country polygons."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
+        country_polygons = boundaries_1970.country_polygons
+        assert {p.entity_type for p in country_polygons} <= {'country'}
 
-        country_polygons = boundaries.country_polygons
-        assert all(p.entity_type == 'country' for p in country_polygons)
-
-    def test_city_markers_filter(self):
+    def test_city_markers_filter(self, boundaries_1970):
         """Test filtering for city markers."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        city_markers = boundaries.city_markers
-        assert all(p.entity_type == 'city' for p in city_markers)
+        city_markers = boundaries_1970.city_markers
+        assert {p.entity_type for p in city_markers} <= {'city'}
 
     # --- Uncertainty Regions ---
 
-    def test_uncertainty_regions_for_partial_overlap(self):
+    def test_uncertainty_regions_for_partial_overlap(self, engine, parser, resolver):
         """Test uncertainty regions are generated for partial overlaps."""
         # Use a range that spans entity transitions
-        resolved = self._get_resolved_state("1988-1995")
-        boundaries = self.engine.generate_boundaries(resolved)
+        resolved = _get_resolved_state(parser, resolver, "1988-1995")
+        boundaries = engine.generate_boundaries(resolved)
 
         # May have uncertainty regions
         assert isinstance(boundaries.uncertainty_regions, list)
@@ -166,32 +174,26 @@ class TestBoundaryEngine:
 
     # --- Known Entities ---
 
-    def test_known_regions(self):
+    def test_known_regions(self, engine):
         """Test that engine knows about major regions."""
-        regions = self.engine.get_available_regions()
+        regions = engine.get_available_regions()
 
         assert 'Germany' in regions
         assert 'Soviet Union' in regions or 'USSR' in regions
         assert 'France' in regions
         assert 'United States' in regions
 
-    def test_city_markers_are_small(self):
+    def test_city_markers_are_small(self, boundaries_1970):
         """Test that city markers are smaller than country polygons."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        for marker in boundaries.city_markers:
+        for marker in boundaries_1970.city_markers:
             # City markers should have exactly 4 points (diamond shape)
             assert len(marker.points) == 4
 
     # --- Color Assignment ---
 
-    def test_entities_have_colors(self):
+    def test_entities_have_colors(self, boundaries_1970):
         """Test that entities are assigned colors."""
-        resolved = self._get_resolved_state("1970")
-        boundaries = self.engine.generate_boundaries(resolved)
-
-        for polygon in boundaries.polygons:
+        for polygon in boundaries_1970.polygons:
             assert polygon.fill_color.startswith('#')
             assert polygon.border_color.startswith('#')
 
@@ -209,3 +211,10 @@ class TestPoint:
         """Test point to tuple conversion."""
         point = Point(10.5, 20.3)
         assert point.to_tuple() == (10.5, 20.3)
+
+    def test_point_has_no_instance_dict(self):
+        """Test that points use slots and still copy correctly."""
+        point = Point(10.5, 20.3)
+
+        assert not hasattr(point, '__dict__')
+        assert copy.deepcopy(point) == point
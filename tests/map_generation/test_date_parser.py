@@ -3,157 +3,133 @@ Tests for the date parser module.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from map_generation.date_parser import DateParser, ParsedDateRange, DateParseError
 
 
+@pytest.fixture(scope="class")
+def parser():
+    """Default date parser shared by a test class (parsing is stateless)."""
+    return DateParser()
+
+
+@pytest.mark.xdist_group("date_parser")
 class TestDateParser:
     """Tests for DateParser class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = DateParser()
-
     # --- Valid Input Tests ---
 
-    def test_parse_single_year(self):
+    def test_parse_single_year(self, parser):
         """Test parsing a single year."""
-        result = self.parser.parse("1914")
+        result = parser.parse("1914")
 
         assert result.year_range.start == 1914
         assert result.year_range.end == 1914
         assert result.is_single_year is True
         assert result.midpoint == 1914
 
-    def test_parse_year_range_dash(self):
-        """Test parsing a year range with dash."""
-        result = self.parser.parse("1918-1939")
-
-        assert result.year_range.start == 1918
-        assert result.year_range.end == 1939
+    @pytest.mark.parametrize("date_str", [
+        "1918-1939",
+        "1918–1939",
+        "1918 - 1939",
+        "1918 to 1939",
+        "1918 through 1939",
+    ], ids=["dash", "en_dash", "spaces", "to", "through"])
+    def test_parse_year_range(self, parser, date_str):
+        """Test parsing a year range in each supported separator style."""
+        result = parser.parse(date_str)
+
+        assert (result.year_range.start, result.year_range.end) == (1918, 1939)
         assert result.is_single_year is False
         assert result.midpoint == 1928
 
-    def test_parse_year_range_en_dash(self):
-        """Test parsing a year range with en-dash."""
-        result = self.parser.parse("1918–1939")
-
-        assert result.year_range.start == 1918
-        assert result.year_range.end == 1939
-
-    def test_parse_year_range_with_spaces(self):
-        """Test parsing a year range with spaces around dash."""
-        result = self.parser.parse("1918 - 1939")
-
-        assert result.year_range.start == 1918
-        assert result.year_range.end == 1939
-
-    def test_parse_year_range_with_to(self):
-        """Test parsing a year range with 'to' keyword."""
-        result = self.parser.parse("1918 to 1939")
-
-        assert result.year_range.start == 1918
-        assert result.year_range.end == 1939
-
-    def test_parse_year_range_with_through(self):
-        """Test parsing a year range with 'through' keyword."""
-        result = self.parser.parse("1918 through 1939")
-
-        assert result.year_range.start == 1918
-        assert result.year_range.end == 1939
-
-    def test_parse_preserves_original_input(self):
+    def test_parse_preserves_original_input(self, parser):
         """Test that original input is preserved."""
-        result = self.parser.parse("  1914  ")
+        result = parser.parse("  1914  ")
 
         assert result.original_input == "  1914  "
 
     # --- Edge Cases ---
 
-    def test_parse_minimum_year(self):
+    def test_parse_minimum_year(self, parser):
         """Test parsing the minimum allowed year."""
-        result = self.parser.parse("1500")
+        result = parser.parse("1500")
 
         assert result.year_range.start == 1500
 
-    def test_parse_current_year(self):
+    def test_parse_current_year(self, parser):
         """Test parsing the current year."""
         import datetime
         current_year = datetime.datetime.now().year
 
-        result = self.parser.parse(str(current_year))
+        result = parser.parse(str(current_year))
 
         assert result.year_range.start == current_year
 
-    def test_single_year_span(self):
+    def test_single_year_span(self, parser):
         """Test that single year has span of 1."""
-        result = self.parser.parse("1914")
+        result = parser.parse("1914")
 
         assert result.span == 1
 
-    def test_range_span(self):
+    def test_range_span(self, parser):
         """Test span calculation for a range."""
-        result = self.parser.parse("1918-1939")
+        result = parser.parse("1918-1939")
 
         assert result.span == 22  # 1918 to 1939 inclusive
 
     # --- Invalid Input Tests ---
 
-    def test_parse_empty_string_raises(self):
+    def test_parse_empty_string_raises(self, parser):
         """Test that empty string raises error."""
         with pytest.raises(DateParseError):
-            self.parser.parse("")
+            parser.parse("")
 
-    def test_parse_none_raises(self):
+    def test_parse_none_raises(self, parser):
         """Test that None raises error."""
         with pytest.raises(DateParseError):
-            self.parser.parse(None)
+            parser.parse(None)
 
-    def test_parse_invalid_format_raises(self):
+    def test_parse_invalid_format_raises(self, parser):
         """Test that invalid format raises error."""
         with pytest.raises(DateParseError):
-            self.parser.parse("not a date")
+            parser.parse("not a date")
 
-    def test_parse_year_before_minimum_raises(self):
+    def test_parse_year_before_minimum_raises(self, parser):
         """Test that year before minimum raises error."""
         with pytest.raises(DateParseError) as excinfo:
-            self.parser.parse("1400")
+            parser.parse("1400")
 
         assert "before minimum" in str(excinfo.value).lower()
 
-    def test_parse_year_after_maximum_raises(self):
+    def test_parse_year_after_maximum_raises(self, parser):
         """Test that year after maximum raises error."""
         with pytest.raises(DateParseError) as excinfo:
-            self.parser.parse("2200")
+            parser.parse("2200")
 
         assert "exceeds maximum" in str(excinfo.value).lower()
 
-    def test_parse_inverted_range_raises(self):
+    def test_parse_inverted_range_raises(self, parser):
         """Test that inverted range raises error."""
         with pytest.raises(DateParseError) as excinfo:
-            self.parser.parse("1939-1918")
+            parser.parse("1939-1918")
 
         assert "after end year" in str(excinfo.value).lower()
 
-    def test_parse_future_year_raises(self):
+    def test_parse_future_year_raises(self, parser):
         """Test that future year raises error when not allowed."""
         import datetime
         future_year = datetime.datetime.now().year + 10
 
         with pytest.raises(DateParseError) as excinfo:
-            self.parser.parse(str(future_year))
+            parser.parse(str(future_year))
 
         assert "future" in str(excinfo.value).lower()
 
-    def test_parse_partial_year_raises(self):
+    def test_parse_partial_year_raises(self, parser):
         """Test that partial year raises error."""
         with pytest.raises(DateParseError):
-            self.parser.parse("191")
+            parser.parse("191")
 
     # --- Configuration Tests ---
 
@@ -181,32 +157,32 @@ class TestDateParser:
 
     # --- Utility Methods ---
 
-    def test_is_valid_true(self):
+    def test_is_valid_true(self, parser):
         """Test is_valid returns True for valid input."""
-        assert self.parser.is_valid("1914") is True
-        assert self.parser.is_valid("1918-1939") is True
+        assert parser.is_valid("1914") is True
+        assert parser.is_valid("1918-1939") is True
 
-    def test_is_valid_false(self):
+    def test_is_valid_false(self, parser):
         """Test is_valid returns False for invalid input."""
-        assert self.parser.is_valid("not a date") is False
-        assert self.parser.is_valid("") is False
-        assert self.parser.is_valid("1400") is False
+        assert parser.is_valid("not a date") is False
+        assert parser.is_valid("") is False
+        assert parser.is_valid("1400") is False
 
-    def test_suggest_correction_single_year(self):
+    def test_suggest_correction_single_year(self, parser):
         """Test correction suggestion for single year in invalid format."""
-        suggestion = self.parser.suggest_correction("year 1914 AD")
+        suggestion = parser.suggest_correction("year 1914 AD")
 
         assert suggestion == "1914"
 
-    def test_suggest_correction_range(self):
+    def test_suggest_correction_range(self, parser):
         """Test correction suggestion for range in invalid format."""
-        suggestion = self.parser.suggest_correction("between 1918 and 1939")
+        suggestion = parser.suggest_correction("between 1918 and 1939")
 
         assert suggestion == "1918-1939"
 
-    def test_suggest_correction_no_suggestion(self):
+    def test_suggest_correction_no_suggestion(self, parser):
         """Test no suggestion for completely invalid input."""
-        suggestion = self.parser.suggest_correction("no dates here")
+        suggestion = parser.suggest_correction("no dates here")
 
         assert suggestion is None
 
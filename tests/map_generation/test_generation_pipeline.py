@@ -2,13 +2,10 @@
 Tests for the map generation pipeline.
 """
 
+import functools
 import pytest
-import sys
-import tempfile
 from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+from unittest import mock
 
 from map_generation.generation_pipeline import (
     MapGenerationPipeline,
@@ -19,104 +16,109 @@ from map_generation.date_parser import DateParseError
 from map_generation.map_renderer import RenderConfig
 
 
+@pytest.fixture(scope="class")
+def pipeline():
+    """Pipeline shared by a test class."""
+    return MapGenerationPipeline()
+
+
+@pytest.fixture(scope="class")
+def generate(pipeline):
+    """
+    pipeline.generate memoized per (date_input, output_format).
+
+    Tests only read the returned results, so identical requests share one
+    render. Calls that write files go through the pipeline directly.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _generate(date_input: str, output_format: str = 'png') -> GeneratedMapResult:
+        return pipeline.generate(date_input, output_format=output_format)
+
+    return _generate
+
+
+@pytest.fixture(scope="class")
+def preview_1970(pipeline):
+    """1970 preview shared by a test class (tests only read it)."""
+    return pipeline.preview("1970")
+
+
+@pytest.mark.xdist_group("pipeline")
 class TestMapGenerationPipeline:
     """Tests for MapGenerationPipeline class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.pipeline = MapGenerationPipeline()
-
     # --- Basic Generation Tests ---
 
-    def test_generate_single_year(self):
+    def test_generate_single_year(self, generate):
         """Test generating a map for a single year."""
-        result = self.pipeline.generate("1914")
+        result = generate("1914")
 
         assert isinstance(result, GeneratedMapResult)
         assert result.date_range.start == 1914
         assert result.date_range.end == 1914
         assert len(result.image_data) > 0
 
-    def test_generate_year_range(self):
+    def test_generate_year_range(self, generate):
         """Test generating a map for a year range."""
-        result = self.pipeline.generate("1918-1939")
+        result = generate("1918-1939")
 
         assert result.date_range.start == 1918
         assert result.date_range.end == 1939
 
-    def test_generate_returns_entities(self):
-        """Test that generation returns entities shown."""
-        result = self.pipeline.generate("1970")
+    def test_generate_1970_invariants(self, generate):
+        """Test entities, uncertainty, confidence and risk level of one 1970 render."""
+        result = generate("1970")
 
         assert len(result.entities_shown) > 0
-        assert all('name' in e for e in result.entities_shown)
-        assert all('type' in e for e in result.entities_shown)
+        assert all(e.keys() >= {'name', 'type'} for e in result.entities_shown)
+
+        assert result.uncertainty is not None
+        assert 0 <= result.uncertainty.overall_score <= 1
+        assert result.confidence == 1.0 - result.uncertainty.overall_score
+        assert result.risk_level in ('low', 'medium', 'high')
 
-    def test_generate_returns_assumptions(self):
+    def test_generate_returns_assumptions(self, generate):
         """Test that generation returns assumptions."""
-        result = self.pipeline.generate("1949-1990")
+        result = generate("1949-1990")
 
         assert len(result.assumptions) > 0
 
-    def test_generate_returns_uncertainty(self):
-        """Test that generation returns uncertainty assessment."""
-        result = self.pipeline.generate("1970")
-
-        assert result.uncertainty is not None
-        assert 0 <= result.uncertainty.overall_score <= 1
-
     # --- Output Format Tests ---
 
-    def test_generate_png_format(self):
+    def test_generate_png_format(self, generate):
         """Test PNG output format."""
-        result = self.pipeline.generate("1970", output_format='png')
+        result = generate("1970")
 
         assert result.metadata['output_format'] == 'png'
         # PNG starts with specific bytes
         assert result.image_data[:4] == b'\x89PNG' or len(result.image_data) > 0
 
-    def test_generate_svg_format(self):
+    def test_generate_svg_format(self, generate):
         """Test SVG output format."""
-        result = self.pipeline.generate("1970", output_format='svg')
+        result = generate("1970", 'svg')
 
         assert result.metadata['output_format'] == 'svg'
         svg_text = result.image_data.decode('utf-8')
         assert '<svg' in svg_text
         assert '</svg>' in svg_text
 
-    def test_generate_to_file(self):
+    def test_generate_to_file(self, pipeline, tmp_path):
         """Test saving output to file."""
-        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
-            output_path = f.name
+        output_path = str(tmp_path / "out.svg")
 
-        try:
-            result = self.pipeline.generate("1970", output_path=output_path, output_format='svg')
+        result = pipeline.generate("1970", output_path=output_path, output_format='svg')
 
-            assert result.image_path == output_path
-            assert Path(output_path).exists()
+        assert result.image_path == output_path
+        assert Path(output_path).exists()
 
-            content = Path(output_path).read_text()
-            assert '<svg' in content
-        finally:
-            Path(output_path).unlink(missing_ok=True)
+        content = Path(output_path).read_text()
+        assert '<svg' in content
 
     # --- Properties and Metadata ---
 
-    def test_confidence_property(self):
-        """Test confidence property."""
-        result = self.pipeline.generate("1970")
-
-        assert result.confidence == 1.0 - result.uncertainty.overall_score
-
-    def test_risk_level_property(self):
-        """Test risk level property."""
-        result = self.pipeline.generate("1970")
-
-        assert result.risk_level in ('low', 'medium', 'high')
-
-    def test_metadata_content(self):
+    def test_metadata_content(self, generate):
         """Test metadata contains expected fields."""
-        result = self.pipeline.generate("1914")
+        result = generate("1914")
 
         metadata = result.metadata
         assert 'original_input' in metadata
@@ -128,9 +130,9 @@ class TestMapGenerationPipeline:
 
     # --- Serialization ---
 
-    def test_to_dict(self):
+    def test_to_dict(self, generate):
         """Test serialization to dictionary."""
-        result = self.pipeline.generate("1970")
+        result = generate("1970")
         data = result.to_dict()
 
         assert 'date_range' in data
@@ -142,49 +144,47 @@ class TestMapGenerationPipeline:
 
     # --- Error Handling ---
 
-    def test_invalid_date_raises(self):
+    def test_invalid_date_raises(self, pipeline):
         """Test that invalid date raises error."""
         with pytest.raises(DateParseError):
-            self.pipeline.generate("not a date")
+            pipeline.generate("not a date")
 
-    def test_year_before_minimum_raises(self):
+    def test_year_before_minimum_raises(self, pipeline):
         """Test that year before minimum raises error."""
         with pytest.raises(DateParseError):
-            self.pipeline.generate("1400")
+            pipeline.generate("1400")
 
     # --- Preview Method ---
 
-    def test_preview(self):
+    def test_preview(self, preview_1970):
         """Test preview method."""
-        preview = self.pipeline.preview("1970")
+        assert 'date_range' in preview_1970
+        assert 'entities_count' in preview_1970
+        assert 'dominant_entities' in preview_1970
+        assert 'risk_assessment' in preview_1970
+        assert preview_1970['date_range'] == [1970, 1970]
 
-        assert 'date_range' in preview
-        assert 'entities_count' in preview
-        assert 'dominant_entities' in preview
-        assert 'risk_assessment' in preview
-        assert preview['date_range'] == [1970, 1970]
-
-    def test_preview_does_not_generate_image(self):
+    def test_preview_does_not_generate_image(self, preview_1970):
         """Test that preview doesn't generate an image."""
-        preview = self.pipeline.preview("1970")
-
-        assert 'image_data' not in preview
+        assert 'image_data' not in preview_1970
 
     # --- Utility Methods ---
 
-    def test_is_valid_date(self):
+    @pytest.mark.parametrize("date_input,expected", [
+        ("1914", True),
+        ("1918-1939", True),
+        ("not a date", False),
+    ])
+    def test_is_valid_date(self, pipeline, date_input, expected):
         """Test date validation method."""
-        assert self.pipeline.is_valid_date("1914") is True
-        assert self.pipeline.is_valid_date("1918-1939") is True
-        assert self.pipeline.is_valid_date("not a date") is False
+        assert pipeline.is_valid_date(date_input) is expected
 
-    def test_get_entities_for_year(self):
+    def test_get_entities_for_year(self, pipeline):
         """Test getting entities for a year."""
-        entities = self.pipeline.get_entities_for_year(1970)
+        entities = pipeline.get_entities_for_year(1970)
 
         assert len(entities) > 0
-        assert all('name' in e for e in entities)
-        assert all('type' in e for e in entities)
+        assert all(e.keys() >= {'name', 'type'} for e in entities)
 
 
 class TestGenerateMapFromDate:
@@ -198,17 +198,17 @@ class TestGenerateMapFromDate:
         assert result.date_range.start == 1914
 
     def test_with_output_path(self):
-        """Test with output path."""
-        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
-            output_path = f.name
-
-        try:
-            result = generate_map_from_date("1970", output_path=output_path, output_format='svg')
-
-            assert result.image_path == output_path
-            assert Path(output_path).exists()
-        finally:
-            Path(output_path).unlink(missing_ok=True)
+        """Test the output path is passed through to the pipeline."""
+        # Writing to disk is covered end to end by test_generate_to_file
+        with mock.patch.object(
+            MapGenerationPipeline, 'generate', autospec=True
+        ) as generate:
+            result = generate_map_from_date("1970", output_path="out.svg", output_format='svg')
+
+        assert result is generate.return_value
+        generate.assert_called_once_with(
+            mock.ANY, "1970", "out.svg", 'svg', None, False, None
+        )
 
     def test_with_verbose(self):
         """Test verbose mode."""
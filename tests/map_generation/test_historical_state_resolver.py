@@ -2,12 +2,8 @@
 Tests for the historical state resolver module.
 """
 
+import functools
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from models import YearRange
 from map_generation.date_parser import DateParser, ParsedDateRange
@@ -19,86 +15,69 @@ from map_generation.historical_state_resolver import (
 )
 
 
+@pytest.fixture(scope="class")
+def resolver():
+    """State resolver shared by a test class (tests only read from it)."""
+    return HistoricalStateResolver()
+
+
+_shared_parser = DateParser()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse(date_str: str) -> ParsedDateRange:
+    """Parse a date string once per module (parsing is pure; results are only read)."""
+    return _shared_parser.parse(date_str)
+
+
+@pytest.mark.xdist_group("resolver")
 class TestHistoricalStateResolver:
     """Tests for HistoricalStateResolver class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.resolver = HistoricalStateResolver()
-        self.parser = DateParser()
-
     # --- Basic Resolution Tests ---
 
-    def test_resolve_single_year(self):
-        """Test resolving entities for a single year."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
+    def test_resolve_1970_invariants(self, resolver):
+        """Test one 1970 resolution: range, entities, type filters, Cold War states."""
+        result = resolver.resolve(_parse("1970"))
 
         assert isinstance(result, ResolvedState)
         assert result.date_range.start == 1970
         assert result.date_range.end == 1970
         assert len(result.entities) > 0
+        assert len(result.dominant_entities) > 0
+
+        assert {e.entity_type for e in result.countries} <= {'country'}
+        assert {e.entity_type for e in result.cities} <= {'city'}
+
+        # Should include divided Germany and USSR
+        entity_names = [e.name for e in result.entities]
+        assert 'Soviet Union' in entity_names or 'USSR' in entity_names
+        assert 'East Germany' in entity_names
+        assert 'West Germany' in entity_names
 
-    def test_resolve_year_range(self):
+    def test_resolve_year_range(self, resolver):
         """Test resolving entities for a year range."""
-        parsed = self.parser.parse("1949-1990")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1949-1990")
+        result = resolver.resolve(parsed)
 
         assert result.date_range.start == 1949
         assert result.date_range.end == 1990
         assert len(result.entities) > 0
 
-    def test_resolved_state_has_dominant_entities(self):
-        """Test that resolved state has dominant entities."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
-
-        assert len(result.dominant_entities) > 0
-
-    def test_resolved_state_has_metadata(self):
+    def test_resolved_state_has_metadata(self, resolver):
         """Test that resolved state has metadata."""
-        parsed = self.parser.parse("1949-1990")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1949-1990")
+        result = resolver.resolve(parsed)
 
         assert 'midpoint' in result.metadata
         assert result.metadata['midpoint'] == 1969
 
-    # --- Entity Type Filtering ---
-
-    def test_countries_property(self):
-        """Test filtering for countries."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
-
-        countries = result.countries
-        assert all(e.entity_type == 'country' for e in countries)
-
-    def test_cities_property(self):
-        """Test filtering for cities."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
-
-        cities = result.cities
-        assert all(e.entity_type == 'city' for e in cities)
-
     # --- Specific Historical Periods ---
 
-    def test_cold_war_entities(self):
-        """Test that Cold War entities are found for 1970."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
-
-        entity_names = [e.name for e in result.entities]
-
-        # Should include divided Germany and USSR
-        assert 'Soviet Union' in entity_names or 'USSR' in entity_names
-        assert 'East Germany' in entity_names
-        assert 'West Germany' in entity_names
-
-    def test_post_1991_entities(self):
+    def test_post_1991_entities(self, resolver):
         """Test that modern entities are found for 2000."""
-        parsed = self.parser.parse("2000")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("2000")
+        result = resolver.resolve(parsed)
 
         entity_names = [e.name for e in result.entities]
 
@@ -110,10 +89,10 @@ class TestHistoricalStateResolver:
         assert 'Soviet Union' not in entity_names
         assert 'USSR' not in entity_names
 
-    def test_pre_ww1_entities(self):
+    def test_pre_ww1_entities(self, resolver):
         """Test entities for pre-WWI period."""
-        parsed = self.parser.parse("1910")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1910")
+        result = resolver.resolve(parsed)
 
         entity_names = [e.name for e in result.entities]
 
@@ -123,10 +102,10 @@ class TestHistoricalStateResolver:
 
     # --- Overlap Types ---
 
-    def test_full_overlap_confidence(self):
+    def test_full_overlap_confidence(self, resolver):
         """Test that full overlap entities have high confidence."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1970")
+        result = resolver.resolve(parsed)
 
         # USSR existed 1922-1991, so 1970 is fully covered
         ussr = next((e for e in result.entities if 'Soviet' in e.name or 'USSR' in e.name), None)
@@ -134,10 +113,10 @@ class TestHistoricalStateResolver:
             assert ussr.overlap_type == 'full'
             assert ussr.confidence == 1.0
 
-    def test_partial_overlap_lower_confidence(self):
+    def test_partial_overlap_lower_confidence(self, resolver):
         """Test that partial overlap entities have lower confidence."""
-        parsed = self.parser.parse("1988-1995")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1988-1995")
+        result = resolver.resolve(parsed)
 
         # USSR ended in 1991, so partial overlap
         ussr = next((e for e in result.entities if 'Soviet' in e.name or 'USSR' in e.name), None)
@@ -147,10 +126,10 @@ class TestHistoricalStateResolver:
 
     # --- Conflict Detection ---
 
-    def test_germany_conflict_detection(self):
+    def test_germany_conflict_detection(self, resolver):
         """Test detection of Germany split/unification conflicts."""
-        parsed = self.parser.parse("1985-1995")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1985-1995")
+        result = resolver.resolve(parsed)
 
         # Should detect conflict between East/West Germany and unified Germany
         if result.conflicts:
@@ -165,20 +144,20 @@ class TestHistoricalStateResolver:
 
     # --- Assumptions ---
 
-    def test_assumptions_for_range(self):
+    def test_assumptions_for_range(self, resolver):
         """Test that assumptions are generated for year ranges."""
-        parsed = self.parser.parse("1949-1990")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1949-1990")
+        result = resolver.resolve(parsed)
 
         assert len(result.assumptions) > 0
         # Should mention midpoint for ranges
         assumption_text = ' '.join(result.assumptions)
         assert 'midpoint' in assumption_text.lower() or 'cold war' in assumption_text.lower()
 
-    def test_ww2_period_assumptions(self):
+    def test_ww2_period_assumptions(self, resolver):
         """Test assumptions for WWII period."""
-        parsed = self.parser.parse("1939-1945")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1939-1945")
+        result = resolver.resolve(parsed)
 
         assumption_text = ' '.join(result.assumptions)
         # Should mention WWI or WWII
@@ -186,10 +165,10 @@ class TestHistoricalStateResolver:
 
     # --- Serialization ---
 
-    def test_to_dict(self):
+    def test_to_dict(self, resolver):
         """Test serialization to dictionary."""
-        parsed = self.parser.parse("1970")
-        result = self.resolver.resolve(parsed)
+        parsed = _parse("1970")
+        result = resolver.resolve(parsed)
 
         data = result.to_dict()
 
@@ -201,9 +180,9 @@ class TestHistoricalStateResolver:
 
     # --- Convenience Method ---
 
-    def test_get_entities_for_year(self):
+    def test_get_entities_for_year(self, resolver):
         """Test convenience method for getting entities by year."""
-        entities = self.resolver.get_entities_for_year(1970)
+        entities = resolver.get_entities_for_year(1970)
 
         assert len(entities) > 0
         assert all(e.was_valid_in(1970) for e in entities)
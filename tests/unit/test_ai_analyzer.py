@@ -0,0 +1,348 @@
+"""
+Unit tests for the AI visual analyzer, using fake Anthropic clients.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from models import ProcessedImage
+from visual_features import ai_analyzer
+from visual_features.ai_analyzer import AIVisualAnalyzer, _extract_json_block
+
+IMAGE_B64 = "aW1hZ2U="
+PROMPT = "Date this map"
+
+
+class FakeStream:
+    """Stands in for the context manager returned by messages.stream()."""
+
+    def __init__(self, chunks, stop_reason):
+        self.text_stream = iter(chunks)
+        self._stop_reason = stop_reason
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def get_final_message(self):
+        return SimpleNamespace(stop_reason=self._stop_reason)
+
+
+class FakeClient:
+    """Synchronous client whose streamed reply is fixed up front."""
+
+    def __init__(self, chunks=("reply",), stop_reason="end_turn"):
+        self.chunks = list(chunks)
+        self.stop_reason = stop_reason
+        self.calls = []
+        self.messages = self
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeStream(self.chunks, self.stop_reason)
+
+
+class FakeAsyncClient:
+    """
+    Async client that answers each image with a feature named after it.
+
+    Replies finish in reverse order of arrival, and the peak number of
+    requests in flight is recorded.
+    """
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.messages = self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def create(self, model, max_tokens, messages):
+        name = messages[0]["content"][0]["source"]["data"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01 * (10 - int(name[-1])))
+            if name in self.fail:
+                raise RuntimeError("API unavailable")
+        finally:
+            self.in_flight -= 1
+
+        reply = {"features": [{"feature_type": name, "year_range": {"start": 1900, "end": 1950}}]}
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(reply))],
+            stop_reason="end_turn"
+        )
+
+
+@pytest.fixture
+def make_analyzer(monkeypatch, tmp_path):
+    """Build analyzers around a fake client, caching under tmp_path."""
+    # anthropic itself need not be installed; only the check for it is faked
+    monkeypatch.setattr(ai_analyzer, "anthropic", SimpleNamespace())
+    monkeypatch.setattr(AIVisualAnalyzer, "CACHE_DIR", tmp_path / "claude")
+
+    def make(client=None, use_cache=True):
+        client = client if client is not None else FakeClient()
+        monkeypatch.setattr(ai_analyzer, "_get_client", lambda api_key: client)
+        return AIVisualAnalyzer(
+            api_key="test-key", model="test-model", max_tokens=64,
+            use_cache=use_cache
+        )
+
+    return make
+
+
+class TestResponseCache:
+    """Test the on-disk response cache."""
+
+    def test_default_cache_dir_is_per_user(self):
+        """Test that the default cache lives outside the package."""
+        package_root = Path(ai_analyzer.__file__).parents[2]
+
+        assert package_root not in AIVisualAnalyzer.CACHE_DIR.parents
+
+    def test_hit_served_from_disk(self, make_analyzer, tmp_path):
+        """Test that a repeated request is answered from the cache file."""
+        analyzer = make_analyzer()
+        assert analyzer._request(IMAGE_B64, PROMPT, 64) == "reply"
+        assert len(list((tmp_path / "claude").glob("*.json"))) == 1
+
+        # A fresh analyzer whose client would answer differently
+        other = make_analyzer(FakeClient(chunks=("new reply",)))
+        assert other._request(IMAGE_B64, PROMPT, 64) == "reply"
+        assert other.client.calls == []
+
+    def test_expired_entry_ignored(self, make_analyzer):
+        """Test that an entry older than the TTL triggers a new request."""
+        analyzer = make_analyzer(FakeClient(chunks=("fresh",)))
+        analyzer.cache_ttl = 60
+        cache_key = analyzer._get_cache_key(IMAGE_B64, PROMPT, 64)
+        analyzer._save_to_cache(cache_key, "stale")
+        old = time.time() - 3600
+        os.utime(analyzer._get_cache_path(cache_key), (old, old))
+
+        assert analyzer._request(IMAGE_B64, PROMPT, 64) == "fresh"
+        assert len(analyzer.client.calls) == 1
+
+    def test_truncated_reply_not_cached(self, make_analyzer, tmp_path):
+        """Test that a reply not ending in end_turn is never written."""
+        client = FakeClient(chunks=("partial",), stop_reason="max_tokens")
+        analyzer = make_analyzer(client)
+
+        analyzer._request(IMAGE_B64, PROMPT, 64)
+        analyzer._request(IMAGE_B64, PROMPT, 64)
+
+        assert list((tmp_path / "claude").glob("*.json")) == []
+        assert len(client.calls) == 2
+
+
+class TestStreaming:
+    """Test the on_text streaming callback."""
+
+    REPLY = json.dumps({"features": [{
+        "feature_type": "typography",
+        "description": "Hand lettering",
+        "year_range": {"start": 1850, "end": 1900},
+        "confidence": 0.7,
+        "reasoning": "Pre-mechanical type"
+    }]})
+
+    @pytest.fixture
+    def image(self):
+        return ProcessedImage(image_data=None, original_path="map.png", width=1, height=1)
+
+    @pytest.fixture
+    def analyze(self, make_analyzer, monkeypatch, image):
+        """Run analyze_map_features against a client streaming REPLY in pieces."""
+        chunks = [self.REPLY[i:i + 7] for i in range(0, len(self.REPLY), 7)]
+
+        def analyze(use_cache=False, **kwargs):
+            analyzer = make_analyzer(FakeClient(chunks=chunks), use_cache=use_cache)
+            monkeypatch.setattr(analyzer, "_encode_image", lambda image: IMAGE_B64)
+            return analyzer.analyze_map_features(image, **kwargs)
+
+        analyze.chunks = chunks
+        return analyze
+
+    def test_every_delta_reaches_callback(self, analyze):
+        """Test that each streamed text delta is passed on, in order."""
+        received = []
+        analyze(on_text=received.append)
+
+        assert received == analyze.chunks
+
+    def test_streamed_result_matches_non_streaming(self, analyze, make_analyzer):
+        """Test that streaming does not change the parsed features."""
+        streamed = analyze(on_text=lambda text: None)
+
+        assert streamed == analyze()
+        assert streamed == make_analyzer()._parse_response(self.REPLY)
+        assert streamed[0].year_range.start == 1850
+
+    def test_cache_hit_sends_whole_reply(self, analyze):
+        """Test that a cached reply reaches the callback in one piece."""
+        analyze(use_cache=True)
+        received = []
+        analyze(use_cache=True, on_text=received.append)
+
+        assert received == [self.REPLY]
+
+
+class TestAnalyzeBatch:
+    """Test concurrent batch analysis."""
+
+    @pytest.fixture
+    def images(self):
+        return [
+            ProcessedImage(image_data=None, original_path=f"map{i}", width=1, height=1)
+            for i in range(6)
+        ]
+
+    @pytest.fixture
+    def analyzer(self, make_analyzer, monkeypatch):
+        analyzer = make_analyzer(use_cache=False)
+        analyzer.concurrency = 2
+        # The image "encoding" is its path, so replies can be told apart
+        monkeypatch.setattr(analyzer, "_encode_image", lambda image: image.original_path)
+        return analyzer
+
+    def _run(self, analyzer, images, client, monkeypatch):
+        monkeypatch.setattr(
+            ai_analyzer, "anthropic",
+            SimpleNamespace(AsyncAnthropic=lambda api_key: client)
+        )
+        return asyncio.run(analyzer.analyze_batch(images))
+
+    def test_results_in_input_order(self, analyzer, images, monkeypatch):
+        """Test that results follow input order, not completion order."""
+        results = self._run(analyzer, images, FakeAsyncClient(), monkeypatch)
+
+        assert [[f.feature_type for f in r] for r in results] == [
+            [image.original_path] for image in images
+        ]
+
+    def test_concurrency_cap(self, analyzer, images, monkeypatch):
+        """Test that no more than `concurrency` requests run at once."""
+        client = FakeAsyncClient()
+        self._run(analyzer, images, client, monkeypatch)
+
+        assert client.max_in_flight == analyzer.concurrency
+
+    def test_failed_request_yields_empty_list(self, analyzer, images, monkeypatch):
+        """Test that one failing request does not fail the rest of the batch."""
+        results = self._run(analyzer, images, FakeAsyncClient(fail={"map3"}), monkeypatch)
+
+        assert results[3] == []
+        assert [len(r) for r in results] == [1, 1, 1, 0, 1, 1]
+
+
+# The regex _extract_json_block replaced; both must agree on every case
+_REFERENCE_FENCE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+JSON_BLOCK_CASES = [
+    pytest.param('```json\n{"features": []}\n```', '{"features": []}', id="json-fence"),
+    pytest.param('```\n{"features": []}\n```', '```\n{"features": []}\n```', id="bare-fence"),
+    pytest.param('{"features": []}', '{"features": []}', id="no-fence"),
+    pytest.param('```json\n{"features": []}', '```json\n{"features": []}', id="unterminated-fence"),
+    pytest.param(
+        'Here is my analysis:\n```json\n{"features": [1]}\n```\nLet me know.',
+        '{"features": [1]}',
+        id="surrounding-prose"
+    ),
+]
+
+
+class TestExtractJsonBlock:
+    """Test extraction of the JSON payload from a reply."""
+
+    @pytest.mark.parametrize("text, expected", JSON_BLOCK_CASES)
+    def test_extract(self, text, expected):
+        """Test the extracted block for each reply shape."""
+        assert _extract_json_block(text) == expected
+
+    @pytest.mark.parametrize("text, expected", JSON_BLOCK_CASES)
+    def test_matches_reference_regex(self, text, expected):
+        """Test that the str.find scan agrees with the original regex."""
+        match = _REFERENCE_FENCE.search(text)
+
+        assert _extract_json_block(text) == (match.group(1) if match else text)
+
+
+class FakeCV2:
+    """Minimal cv2 stand-in that counts encodes; the 'JPEG' is the raw pixels."""
+
+    INTER_AREA = IMWRITE_JPEG_QUALITY = IMWRITE_JPEG_OPTIMIZE = 0
+
+    def __init__(self):
+        self.encodes = 0
+
+    def resize(self, img, dsize, fx, fy, interpolation):
+        return img[::2, ::2]
+
+    def imencode(self, ext, img, params):
+        self.encodes += 1
+        return True, np.frombuffer(img.tobytes(), dtype=np.uint8)
+
+
+class TestImageEncoding:
+    """Test the per-image encoding cache."""
+
+    @pytest.fixture
+    def cv2(self, monkeypatch):
+        fake = FakeCV2()
+        monkeypatch.setitem(sys.modules, "cv2", fake)
+        return fake
+
+    @pytest.fixture
+    def image(self):
+        return ProcessedImage(
+            image_data=np.zeros((4, 4, 3), dtype=np.uint8),
+            original_path="map.png",
+            width=4,
+            height=4
+        )
+
+    def test_encoding_reused(self, make_analyzer, cv2, image):
+        """Test that an unchanged image is encoded once."""
+        analyzer = make_analyzer()
+
+        first = analyzer._encode_image(image)
+        assert analyzer._encode_image(image) == first
+        assert cv2.encodes == 1
+
+    def test_in_place_edit_re_encodes(self, make_analyzer, cv2, image):
+        """Test that modifying the pixels in place invalidates the encoding."""
+        analyzer = make_analyzer()
+        first = analyzer._encode_image(image)
+
+        image.image_data[0, 0, 0] = 255
+
+        assert analyzer._encode_image(image) != first
+        assert cv2.encodes == 2
+
+    def test_replaced_array_re_encodes(self, make_analyzer, cv2, image):
+        """Test that a new array of another shape is not served the old encoding."""
+        analyzer = make_analyzer()
+        first = analyzer._encode_image(image)
+
+        image.image_data = np.zeros((4, 2, 3), dtype=np.uint8)
+
+        assert analyzer._encode_image(image) != first
+        assert cv2.encodes == 2
@@ -0,0 +1,64 @@
+"""
+Unit tests for the (stubbed) visual feature extractor.
+"""
+
+import numpy as np
+import pytest
+
+from models import ProcessedImage, VisualFeature
+from visual_features import VisualFeatureExtractor
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Extractor shared by the module (stateless)."""
+    return VisualFeatureExtractor()
+
+
+@pytest.fixture(scope="module")
+def image():
+    """Small blank processed image; the stubs never look at pixels."""
+    return ProcessedImage(
+        image_data=np.zeros((8, 8, 3), dtype=np.uint8),
+        original_path="blank.png",
+        width=8,
+        height=8
+    )
+
+
+class TestVisualFeatureExtractor:
+    """Test VisualFeatureExtractor functionality."""
+
+    def test_extract_all_features(self, extractor, image):
+        """Test that one feature is returned per available type, in order."""
+        features = extractor.extract_all_features(image)
+
+        assert all(isinstance(f, VisualFeature) for f in features)
+        assert [f.feature_type for f in features] == extractor.get_available_feature_types()
+        assert all(f.metadata['status'] == 'stub' for f in features)
+        assert all(f.year_range is None for f in features)
+
+    def test_extract_all_features_shares_stubs(self, extractor, image):
+        """Test that repeated calls return the same shared stub instances."""
+        first = extractor.extract_all_features(image)
+        second = extractor.extract_all_features(image)
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_get_available_feature_types(self, extractor):
+        """Test the feature type list and that callers get their own copy."""
+        types = extractor.get_available_feature_types()
+
+        assert types == [
+            'border_style', 'color_palette', 'typography',
+            'projection', 'infrastructure'
+        ]
+        types.append('extra')
+        assert 'extra' not in extractor.get_available_feature_types()
+
+    def test_extract_specific_features(self, extractor, image):
+        """Test filtering by feature type."""
+        features = extractor.extract_specific_features(image, ['typography', 'unknown'])
+
+        assert [f.feature_type for f in features] == ['typography']
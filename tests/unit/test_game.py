@@ -2,11 +2,8 @@
 Unit tests for game components.
 """
 
-import unittest
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent / 'src'))
+import numpy as np
+import pytest
 
 from models import YearRange
 from game.game_models import UserGuess, DifficultyLevel, PlayerStats, ScoreBreakdown
@@ -14,162 +11,239 @@ from game.round_generator import RoundGenerator
 from scoring.score_calculator import ScoreCalculator
 
 
-class TestUserGuess(unittest.TestCase):
+@pytest.fixture(scope="class")
+def calculator():
+    """Score calculator shared by a test class (scoring is pure)."""
+    return ScoreCalculator()
+
+
+@pytest.fixture(scope="class")
+def round_gen():
+    """Round generator shared by a test class."""
+    return RoundGenerator()
+
+
+@pytest.fixture(scope="class")
+def rounds(round_gen):
+    """One mock round per difficulty level, shared by a test class."""
+    return {level: round_gen.create_mock_round(level) for level in DifficultyLevel}
+
+
+@pytest.fixture(scope="class")
+def beginner_round(round_gen):
+    """Mock beginner round shared by a test class (tests only read it)."""
+    return round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+
+
+@pytest.fixture(scope="class")
+def answer_range(beginner_round):
+    """System answer range of the shared beginner round."""
+    return beginner_round.get_answer_range()
+
+
+@pytest.fixture(scope="class")
+def most_likely(beginner_round):
+    """Most likely year of the shared beginner round."""
+    return beginner_round.system_estimate.most_likely_year
+
+
+class TestUserGuess:
     """Test UserGuess functionality."""
 
     def test_point_guess(self):
         """Test single-year guess."""
         guess = UserGuess(year=1950)
 
-        self.assertTrue(guess.is_point_guess())
-        self.assertEqual(guess.get_width(), 0)
+        assert guess.is_point_guess()
+        assert guess.get_width() == 0
 
         guess_range = guess.to_range()
-        self.assertEqual(guess_range.start, 1950)
-        self.assertEqual(guess_range.end, 1950)
+        assert guess_range.start == 1950
+        assert guess_range.end == 1950
 
     def test_range_guess(self):
         """Test year range guess."""
         guess = UserGuess(year_range=YearRange(1940, 1960))
 
-        self.assertFalse(guess.is_point_guess())
-        self.assertEqual(guess.get_width(), 20)
+        assert not guess.is_point_guess()
+        assert guess.get_width() == 20
 
         guess_range = guess.to_range()
-        self.assertEqual(guess_range.start, 1940)
-        self.assertEqual(guess_range.end, 1960)
+        assert guess_range.start == 1940
+        assert guess_range.end == 1960
 
     def test_invalid_guess(self):
         """Test that invalid guesses raise errors."""
         # No guess provided
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             UserGuess()
 
         # Both types provided
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             UserGuess(year=1950, year_range=YearRange(1940, 1960))
 
 
-class TestScoreCalculator(unittest.TestCase):
+@pytest.mark.xdist_group("score_calculator")
+class TestScoreCalculator:
     """Test score calculation logic."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.calculator = ScoreCalculator()
-        self.round_gen = RoundGenerator()
-
-    def test_perfect_guess(self):
+    def test_perfect_guess(self, calculator, beginner_round, answer_range):
         """Test scoring for a perfect guess."""
-        # Create a mock round
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = beginner_round
 
         # Guess the exact answer
-        answer_range = game_round.get_answer_range()
         guess = UserGuess(year_range=answer_range)
 
-        score = self.calculator.calculate_score(guess, game_round)
+        score = calculator.calculate_score(guess, game_round)
 
         # Should get high base score (100% overlap)
-        self.assertEqual(score.overlap_percentage, 100.0)
-        self.assertEqual(score.years_off, 0)
-        self.assertGreater(score.final_score, 70)
+        assert score.overlap_percentage == 100.0
+        assert score.years_off == 0
+        assert score.final_score > 70
 
-    def test_partial_overlap(self):
+    def test_partial_overlap(self, calculator, beginner_round):
         """Test scoring for partial overlap."""
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = beginner_round
 
         # Answer is 1949-1990, guess 1960-1980 (partial overlap)
         guess = UserGuess(year_range=YearRange(1960, 1980))
 
-        score = self.calculator.calculate_score(guess, game_round)
+        score = calculator.calculate_score(guess, game_round)
 
         # Should have some overlap
-        self.assertGreater(score.overlap_percentage, 0)
-        self.assertGreater(score.final_score, 0)
+        assert score.overlap_percentage > 0
+        assert score.final_score > 0
 
-    def test_complete_miss(self):
+    def test_complete_miss(self, calculator, beginner_round):
         """Test scoring for a complete miss."""
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = beginner_round
 
         # Answer is 1949-1990, guess 1800-1850 (no overlap)
         guess = UserGuess(year_range=YearRange(1800, 1850))
 
-        score = self.calculator.calculate_score(guess, game_round)
+        score = calculator.calculate_score(guess, game_round)
 
         # Should have no overlap
-        self.assertEqual(score.overlap_percentage, 0.0)
-        self.assertGreater(score.years_off, 0)
+        assert score.overlap_percentage == 0.0
+        assert score.years_off > 0
 
-    def test_narrow_correct_guess_bonus(self):
+    def test_narrow_correct_guess_bonus(self, calculator, beginner_round, most_likely):
         """Test that narrow correct guesses get bonuses."""
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = beginner_round
 
         # Narrow guess within answer range
-        most_likely = game_round.system_estimate.most_likely_year
         narrow_guess = UserGuess(year_range=YearRange(most_likely - 2, most_likely + 2))
 
         # Wide guess
         wide_guess = UserGuess(year_range=YearRange(1900, 2000))
 
-        narrow_score = self.calculator.calculate_score(narrow_guess, game_round)
-        wide_score = self.calculator.calculate_score(wide_guess, game_round)
+        narrow_score = calculator.calculate_score(narrow_guess, game_round)
+        wide_score = calculator.calculate_score(wide_guess, game_round)
 
         # Narrow guess should get accuracy bonus
-        self.assertGreater(narrow_score.accuracy_bonus, 0)
-        self.assertGreater(narrow_score.final_score, wide_score.final_score)
+        assert narrow_score.accuracy_bonus > 0
+        assert narrow_score.final_score > wide_score.final_score
 
-    def test_overconfident_penalty(self):
+    def test_overconfident_penalty(self, calculator, beginner_round):
         """Test penalty for narrow wrong guesses."""
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = beginner_round
 
         # Very narrow guess that's wrong (1800)
         overconfident_guess = UserGuess(year=1800)
 
-        score = self.calculator.calculate_score(overconfident_guess, game_round)
+        score = calculator.calculate_score(overconfident_guess, game_round)
 
         # Should have confidence penalty
-        self.assertGreater(score.confidence_penalty, 0)
+        assert score.confidence_penalty > 0
 
-    def test_accuracy_detection(self):
+    def test_accuracy_detection(self, calculator, beginner_round, answer_range, most_likely):
         """Test accurate/exact detection."""
-        game_round = self.round_gen.create_mock_round(DifficultyLevel.BEGINNER)
-
-        answer_range = game_round.get_answer_range()
-        most_likely = game_round.system_estimate.most_likely_year
+        game_round = beginner_round
 
         # Accurate guess (overlaps)
         accurate_guess = UserGuess(year_range=YearRange(
             answer_range.start,
             answer_range.end
         ))
-        self.assertTrue(self.calculator.is_accurate(accurate_guess, game_round))
+        assert calculator.is_accurate(accurate_guess, game_round)
 
         # Exact guess (within 5 years of most likely)
         exact_guess = UserGuess(year=most_likely)
-        self.assertTrue(self.calculator.is_exact(exact_guess, game_round))
+        assert calculator.is_exact(exact_guess, game_round)
 
         # Inaccurate guess (no overlap)
         inaccurate_guess = UserGuess(year=1800)
-        self.assertFalse(self.calculator.is_accurate(inaccurate_guess, game_round))
-
-
-class TestPlayerStats(unittest.TestCase):
+        assert not calculator.is_accurate(inaccurate_guess, game_round)
+
+    def test_batch_matches_single(self, calculator, beginner_round, answer_range, most_likely):
+        """Test that batch scoring agrees with per-guess scoring."""
+        game_round = beginner_round
+
+        guesses = [
+            (1800, 1800), (1800, 1850), (1960, 1980), (1968, 1972),
+            (1900, 2000), (1991, 1991), (1950, 2060), (1970, 1970),
+        ]
+        batch = calculator.calculate_scores_batch(
+            [g[0] for g in guesses],
+            [g[1] for g in guesses],
+            [answer_range.start] * len(guesses),
+            [answer_range.end] * len(guesses),
+            [most_likely] * len(guesses),
+            [game_round.difficulty] * len(guesses)
+        )
+
+        for i, (start, end) in enumerate(guesses):
+            score = calculator.calculate_score(
+                UserGuess(year_range=YearRange(start, end)), game_round
+            )
+            assert batch['final_score'][i] == pytest.approx(score.final_score)
+            assert batch['accuracy_bonus'][i] == pytest.approx(score.accuracy_bonus)
+            assert batch['confidence_penalty'][i] == pytest.approx(score.confidence_penalty)
+            assert batch['years_off'][i] == score.years_off
+
+        # The NumPy fallback must agree with whichever path was used above
+        fallback = calculator._scores_batch_numpy(
+            *(np.asarray(col, dtype=np.int32) for col in (
+                [g[0] for g in guesses],
+                [g[1] for g in guesses],
+                [answer_range.start] * len(guesses),
+                [answer_range.end] * len(guesses),
+                [most_likely] * len(guesses),
+            )),
+            batch['difficulty_multiplier']
+        )
+        np.testing.assert_allclose(fallback['final_score'], batch['final_score'])
+
+    def test_evaluate_matches_separate_calls(self, calculator, beginner_round):
+        """Test that evaluate agrees with is_accurate, is_exact and calculate_score."""
+        game_round = beginner_round
+
+        for start, end in [(1800, 1850), (1960, 1980), (1900, 2000), (1950, 1964)]:
+            guess = UserGuess(year_range=YearRange(start, end))
+            accurate, exact, score = calculator.evaluate(guess, game_round)
+
+            assert accurate == calculator.is_accurate(guess, game_round)
+            assert exact == calculator.is_exact(guess, game_round)
+            assert score == calculator.calculate_score(guess, game_round)
+
+
+class TestPlayerStats:
     """Test player statistics."""
 
     def test_initial_stats(self):
         """Test initial player stats."""
         stats = PlayerStats(player_id="test_player")
 
-        self.assertEqual(stats.rounds_played, 0)
-        self.assertEqual(stats.get_average_score(), 0.0)
-        self.assertEqual(stats.get_accuracy_rate(), 0.0)
+        assert stats.rounds_played == 0
+        assert stats.get_average_score() == 0.0
+        assert stats.get_accuracy_rate() == 0.0
 
     def test_difficulty_progression(self):
         """Test difficulty recommendation."""
         stats = PlayerStats(player_id="test_player")
 
         # Should start at beginner
-        self.assertEqual(stats.get_suggested_difficulty(), DifficultyLevel.BEGINNER)
+        assert stats.get_suggested_difficulty() == DifficultyLevel.BEGINNER
 
         # After 3 good rounds, should recommend intermediate
         stats.rounds_played = 3
@@ -177,44 +251,37 @@ class TestPlayerStats(unittest.TestCase):
         stats.accurate_guesses = 3
         stats.total_score = 210  # Avg 70
 
-        self.assertEqual(stats.get_suggested_difficulty(), DifficultyLevel.INTERMEDIATE)
+        assert stats.get_suggested_difficulty() == DifficultyLevel.INTERMEDIATE
 
 
-class TestRoundGenerator(unittest.TestCase):
+@pytest.mark.xdist_group("round_generator")
+class TestRoundGenerator:
     """Test game round generation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.generator = RoundGenerator()
-
-    def test_mock_round_generation(self):
+    def test_mock_round_generation(self, rounds):
         """Test creating mock rounds."""
         # Beginner round
-        beginner_round = self.generator.create_mock_round(DifficultyLevel.BEGINNER)
-        self.assertIsNotNone(beginner_round)
-        self.assertEqual(beginner_round.difficulty, DifficultyLevel.BEGINNER)
-        self.assertGreater(len(beginner_round.get_key_signals()), 0)
+        beginner_round = rounds[DifficultyLevel.BEGINNER]
+        assert beginner_round is not None
+        assert beginner_round.difficulty == DifficultyLevel.BEGINNER
+        assert len(beginner_round.get_key_signals()) > 0
 
         # Intermediate round
-        intermediate_round = self.generator.create_mock_round(DifficultyLevel.INTERMEDIATE)
-        self.assertEqual(intermediate_round.difficulty, DifficultyLevel.INTERMEDIATE)
+        intermediate_round = rounds[DifficultyLevel.INTERMEDIATE]
+        assert intermediate_round.difficulty == DifficultyLevel.INTERMEDIATE
 
         # Expert round
-        expert_round = self.generator.create_mock_round(DifficultyLevel.EXPERT)
-        self.assertEqual(expert_round.difficulty, DifficultyLevel.EXPERT)
+        expert_round = rounds[DifficultyLevel.EXPERT]
+        assert expert_round.difficulty == DifficultyLevel.EXPERT
 
-    def test_round_has_answer(self):
+    def test_round_has_answer(self, rounds):
         """Test that rounds have valid answers."""
-        game_round = self.generator.create_mock_round(DifficultyLevel.BEGINNER)
+        game_round = rounds[DifficultyLevel.BEGINNER]
 
         answer_range = game_round.get_answer_range()
-        self.assertIsNotNone(answer_range)
-        self.assertGreater(answer_range.end, answer_range.start)
+        assert answer_range is not None
+        assert answer_range.end > answer_range.start
 
         confidence = game_round.get_confidence()
-        self.assertGreater(confidence, 0)
-        self.assertLessEqual(confidence, 1.0)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert confidence > 0
+        assert confidence <= 1.0
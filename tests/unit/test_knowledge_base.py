@@ -2,105 +2,181 @@
 Unit tests for historical knowledge base.
 """
 
-import unittest
-import sys
-from pathlib import Path
+import functools
 
-sys.path.append(str(Path(__file__).parent.parent.parent / 'src'))
+import numpy as np
+import pytest
 
-from knowledge import HistoricalKnowledgeBase
-from models import YearRange
+from knowledge import HistoricalKnowledgeBase, EntityIntervalIndex
+from models import HistoricalEntity, YearRange
 
 
-class TestHistoricalKnowledgeBase(unittest.TestCase):
-    """Test HistoricalKnowledgeBase functionality."""
+@pytest.fixture(scope="class")
+def kb():
+    """Knowledge base shared by a test class (tests only read it)."""
+    return HistoricalKnowledgeBase()
+
+
+@pytest.fixture(scope="class")
+def name_index(kb):
+    """
+    Lowercased name -> first entity with that name, matching find_by_name.
+
+    Used where a test only needs the entity, not the lookup.
+    """
+    index = {}
+    for entity in kb.all_entities():
+        for name in (entity.name, entity.canonical_name, *entity.alternative_names):
+            index.setdefault(name.lower(), entity)
+    return index
+
+
+@pytest.fixture(scope="class")
+def valid_names(kb):
+    """Canonical names of entities valid in a year, queried once per year."""
+    @functools.lru_cache(maxsize=None)
+    def _valid_names(year):
+        return frozenset(e.canonical_name for e in kb.get_entities_valid_in_year(year))
 
-    def setUp(self):
-        """Set up test knowledge base."""
-        self.kb = HistoricalKnowledgeBase()
+    return _valid_names
 
-    def test_default_entities_loaded(self):
+
+@pytest.mark.xdist_group("knowledge_base")
+class TestHistoricalKnowledgeBase:
+    """Test HistoricalKnowledgeBase functionality."""
+
+    def test_default_entities_loaded(self, kb):
         """Test that default entities are loaded."""
-        entities = self.kb.all_entities()
-        self.assertGreater(len(entities), 0)
+        entities = kb.all_entities()
+        assert len(entities) > 0
 
-    def test_get_entities_by_type(self):
+    def test_get_entities_by_type(self, kb):
         """Test filtering entities by type."""
-        countries = self.kb.get_entities_by_type('country')
-        cities = self.kb.get_entities_by_type('city')
+        countries = kb.get_entities_by_type('country')
+        cities = kb.get_entities_by_type('city')
 
-        self.assertGreater(len(countries), 0)
-        self.assertGreater(len(cities), 0)
+        assert len(countries) > 0
+        assert len(cities) > 0
 
         # Verify types
         for entity in countries:
-            self.assertEqual(entity.entity_type, 'country')
+            assert entity.entity_type == 'country'
 
-    def test_find_by_name(self):
+    def test_find_by_name(self, kb):
         """Test finding entities by name."""
         # Find USSR by primary name
-        ussr = self.kb.find_by_name('USSR')
-        self.assertIsNotNone(ussr)
-        self.assertEqual(ussr.canonical_name, 'Soviet Union')
+        ussr = kb.find_by_name('USSR')
+        assert ussr is not None
+        assert ussr.canonical_name == 'Soviet Union'
 
         # Find by canonical name
-        ussr2 = self.kb.find_by_name('Soviet Union')
-        self.assertIsNotNone(ussr2)
+        ussr2 = kb.find_by_name('Soviet Union')
+        assert ussr2 is not None
 
         # Find by alternative name
-        ussr3 = self.kb.find_by_name('U.S.S.R.')
-        self.assertIsNotNone(ussr3)
+        ussr3 = kb.find_by_name('U.S.S.R.')
+        assert ussr3 is not None
 
         # Non-existent entity
-        fake = self.kb.find_by_name('Nonexistent Country')
-        self.assertIsNone(fake)
+        fake = kb.find_by_name('Nonexistent Country')
+        assert fake is None
 
-    def test_get_entities_valid_in_year(self):
+    def test_get_entities_valid_in_year(self, valid_names):
         """Test finding entities valid in a specific year."""
         # 1950: USSR should exist, Russian Empire should not
-        entities_1950 = self.kb.get_entities_valid_in_year(1950)
-        names_1950 = [e.canonical_name for e in entities_1950]
+        names_1950 = valid_names(1950)
 
-        self.assertIn('Soviet Union', names_1950)
-        self.assertNotIn('Russian Empire', names_1950)
+        assert 'Soviet Union' in names_1950
+        assert 'Russian Empire' not in names_1950
 
         # 1900: Russian Empire should exist, USSR should not
-        entities_1900 = self.kb.get_entities_valid_in_year(1900)
-        names_1900 = [e.canonical_name for e in entities_1900]
+        names_1900 = valid_names(1900)
 
-        self.assertIn('Russian Empire', names_1900)
-        self.assertNotIn('Soviet Union', names_1900)
+        assert 'Russian Empire' in names_1900
+        assert 'Soviet Union' not in names_1900
 
-    def test_city_name_changes(self):
+    def test_city_name_changes(self, name_index):
         """Test historical city name changes."""
         # Constantinople vs Istanbul
-        constantinople = self.kb.find_by_name('Constantinople')
-        istanbul = self.kb.find_by_name('Istanbul')
+        constantinople = name_index.get('constantinople')
+        istanbul = name_index.get('istanbul')
 
-        self.assertIsNotNone(constantinople)
-        self.assertIsNotNone(istanbul)
+        assert constantinople is not None
+        assert istanbul is not None
 
         # Constantinople valid before 1930
-        self.assertTrue(constantinople.was_valid_in(1920))
-        self.assertFalse(constantinople.was_valid_in(1940))
+        assert constantinople.was_valid_in(1920)
+        assert not constantinople.was_valid_in(1940)
 
         # Istanbul valid after 1930
-        self.assertTrue(istanbul.was_valid_in(1940))
+        assert istanbul.was_valid_in(1940)
 
-    def test_country_splits(self):
+    def test_country_splits(self, name_index):
         """Test countries that split."""
         # Czechoslovakia existed 1918-1993
-        czechoslovakia = self.kb.find_by_name('Czechoslovakia')
-        self.assertIsNotNone(czechoslovakia)
-        self.assertTrue(czechoslovakia.was_valid_in(1980))
-        self.assertFalse(czechoslovakia.was_valid_in(2000))
+        czechoslovakia = name_index.get('czechoslovakia')
+        assert czechoslovakia is not None
+        assert czechoslovakia.was_valid_in(1980)
+        assert not czechoslovakia.was_valid_in(2000)
 
         # Czech Republic exists post-1993
-        czech = self.kb.find_by_name('Czech Republic')
-        self.assertIsNotNone(czech)
-        self.assertTrue(czech.was_valid_in(2000))
-        self.assertFalse(czech.was_valid_in(1980))
-
-
-if __name__ == '__main__':
-    unittest.main()
+        czech = name_index.get('czech republic')
+        assert czech is not None
+        assert czech.was_valid_in(2000)
+        assert not czech.was_valid_in(1980)
+
+    def test_add_entity_updates_year_query(self):
+        """Test that year queries see entities added after a query."""
+        kb = HistoricalKnowledgeBase()
+        before = kb.get_entities_valid_in_year(1950)
+
+        entity = HistoricalEntity(
+            name="Test Land",
+            canonical_name="Test Land",
+            entity_type="country",
+            valid_range=YearRange(1949, 1951)
+        )
+        kb.add_entity(entity)
+
+        assert kb.get_entities_valid_in_year(1950) == before + [entity]
+
+
+@pytest.fixture(scope="class")
+def validity_mask(kb):
+    """
+    (years, mask) with mask[y, i] true iff entity i was valid in years[y].
+
+    Built in one broadcast over the entities' start/end arrays.
+    """
+    entities = kb.all_entities()
+    starts = np.fromiter((e.valid_range.start for e in entities), dtype=np.int16, count=len(entities))
+    ends = np.fromiter((e.valid_range.end for e in entities), dtype=np.int16, count=len(entities))
+    years = np.arange(1600, 2101, dtype=np.int16)[:, None]
+    return years[:, 0], (starts <= years) & (years <= ends)
+
+
+@pytest.mark.xdist_group("entity_index")
+class TestEntityIntervalIndex:
+    """Test EntityIntervalIndex against a brute-force scan."""
+
+    def test_matches_linear_scan(self, kb, validity_mask):
+        """Test that every year returns the scanned entities, in order."""
+        entities = kb.all_entities()
+        index = EntityIntervalIndex(entities)
+        years, mask = validity_mask
+
+        for year, row in zip(years.tolist(), mask):
+            expected = [entities[i] for i in np.flatnonzero(row)]
+            assert index.valid_in(year) == expected
+
+    def test_mask_agrees_with_was_valid_in(self, kb, validity_mask):
+        """Test the vectorized reference against was_valid_in for USSR."""
+        entities = kb.all_entities()
+        ussr = next(i for i, e in enumerate(entities) if e.name == 'USSR')
+        years, mask = validity_mask
+
+        assert mask[:, ussr].tolist() == [entities[ussr].was_valid_in(y) for y in years.tolist()]
+
+    def test_empty(self):
+        """Test that an empty index finds nothing."""
+        assert EntityIntervalIndex([]).valid_in(1950) == []
@@ -2,104 +2,183 @@
 Unit tests for core data models.
 """
 
-import unittest
-import sys
-from pathlib import Path
+from dataclasses import FrozenInstanceError
 
-sys.path.append(str(Path(__file__).parent.parent.parent / 'src'))
+import numpy as np
+import pytest
+from hypothesis import given, strategies as st
 
 from models import YearRange, HistoricalEntity, DateSignal, SignalType
 
-
-class TestYearRange(unittest.TestCase):
+# Shared ranges for the overlap/intersection cases; tests only read them
+YR_1900_1950 = YearRange(1900, 1950)
+YR_1940_1990 = YearRange(1940, 1990)
+YR_1960_2000 = YearRange(1960, 2000)
+
+# Arbitrary valid ranges, including single years and shared endpoints
+_years = st.integers(min_value=1000, max_value=2100)
+year_ranges = st.builds(
+    lambda a, b: YearRange(min(a, b), max(a, b)), _years, _years
+)
+
+# Default DateSignal arguments; tests override only the fields they check
+_SIGNAL_DEFAULTS = dict(
+    signal_type=SignalType.ENTITY,
+    description="Test",
+    year_range=YR_1900_1950,
+    confidence=0.5,
+    source="test",
+    reasoning="test"
+)
+
+
+def _make_signal(**overrides):
+    """Build a DateSignal from the defaults plus the given overrides."""
+    return DateSignal(**{**_SIGNAL_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def ussr():
+    """USSR entity shared by the module (tests only read it)."""
+    return HistoricalEntity(
+        name="USSR",
+        canonical_name="Soviet Union",
+        entity_type="country",
+        valid_range=YearRange(1922, 1991),
+        alternative_names=["U.S.S.R.", "Soviet Union"]
+    )
+
+
+class TestYearRange:
     """Test YearRange functionality."""
 
     def test_valid_range(self):
         """Test creating a valid year range."""
         yr = YearRange(1900, 1950)
-        self.assertEqual(yr.start, 1900)
-        self.assertEqual(yr.end, 1950)
+        assert yr.start == 1900
+        assert yr.end == 1950
 
     def test_invalid_range(self):
         """Test that invalid ranges raise errors."""
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError, match="Invalid range: 1950 > 1900"):
             YearRange(1950, 1900)
 
-    def test_overlaps(self):
+    @pytest.mark.parametrize("yr1,yr2,expected", [
+        (YR_1900_1950, YR_1940_1990, True),
+        (YR_1940_1990, YR_1900_1950, True),
+        (YR_1900_1950, YR_1960_2000, False),
+    ])
+    def test_overlaps(self, yr1, yr2, expected):
         """Test overlap detection."""
-        yr1 = YearRange(1900, 1950)
-        yr2 = YearRange(1940, 1990)
-        yr3 = YearRange(1960, 2000)
-
-        self.assertTrue(yr1.overlaps(yr2))
-        self.assertTrue(yr2.overlaps(yr1))
-        self.assertFalse(yr1.overlaps(yr3))
+        assert yr1.overlaps(yr2) is expected
 
-    def test_intersection(self):
+    @pytest.mark.parametrize("yr1,yr2,expected", [
+        (YR_1900_1950, YR_1940_1990, (1940, 1950)),  # Overlapping ranges
+        (YR_1900_1950, YR_1960_2000, None),          # Non-overlapping ranges
+    ])
+    def test_intersection(self, yr1, yr2, expected):
         """Test range intersection."""
-        yr1 = YearRange(1900, 1950)
-        yr2 = YearRange(1940, 1990)
-        yr3 = YearRange(1960, 2000)
+        intersection = yr1.intersection(yr2)
+
+        if expected is None:
+            assert intersection is None
+        else:
+            assert (intersection.start, intersection.end) == expected
+
+    def test_overlaps_batch(self):
+        """Test the pairwise batch form against the scalar overlaps."""
+        ranges = [YR_1900_1950, YR_1940_1990, YR_1960_2000, YearRange(1950, 1950)]
+        starts = np.array([r.start for r in ranges])
+        ends = np.array([r.end for r in ranges])
+
+        result = YearRange.overlaps_batch(starts[:1], ends[:1], starts[1:3], ends[1:3])
+        assert result.tolist() == [[True, False]]
+
+        full = YearRange.overlaps_batch(starts, ends, starts, ends)
+        assert full.tolist() == [[a.overlaps(b) for b in ranges] for a in ranges]
+
+        narrow = YearRange.overlaps_batch(
+            starts.astype(np.int16), ends.astype(np.int16),
+            starts.astype(np.int16), ends.astype(np.int16)
+        )
+        assert narrow.tolist() == full.tolist()
+
+    def test_touching_endpoints_overlap(self):
+        """Test that ranges sharing only an endpoint overlap in that year."""
+        intersection = YearRange(1900, 1950).intersection(YearRange(1950, 2000))
 
-        # Overlapping ranges
+        assert (intersection.start, intersection.end) == (1950, 1950)
+
+    @given(year_ranges, year_ranges)
+    def test_overlaps_symmetric(self, yr1, yr2):
+        """Test that overlap does not depend on argument order."""
+        assert yr1.overlaps(yr2) == yr2.overlaps(yr1)
+
+    @given(year_ranges, year_ranges)
+    def test_intersection_within_both(self, yr1, yr2):
+        """Test that the intersection exists iff the ranges overlap and lies in both."""
         intersection = yr1.intersection(yr2)
-        self.assertIsNotNone(intersection)
-        self.assertEqual(intersection.start, 1940)
-        self.assertEqual(intersection.end, 1950)
 
-        # Non-overlapping ranges
-        intersection = yr1.intersection(yr3)
-        self.assertIsNone(intersection)
+        assert (intersection is not None) == yr1.overlaps(yr2)
+        if intersection is not None:
+            assert intersection.start <= intersection.end
+            assert yr1.start <= intersection.start and intersection.end <= yr1.end
+            assert yr2.start <= intersection.start and intersection.end <= yr2.end
+
+    @given(year_ranges)
+    def test_intersection_with_self(self, yr):
+        """Test that a range intersected with itself is unchanged."""
+        assert yr.intersection(yr) == yr
 
     def test_repr(self):
         """Test string representation."""
         yr1 = YearRange(1900, 1950)
         yr2 = YearRange(1945, 1945)
 
-        self.assertEqual(repr(yr1), "1900-1950")
-        self.assertEqual(repr(yr2), "1945")
+        assert repr(yr1) == "1900-1950"
+        assert repr(yr2) == "1945"
 
+    def test_frozen(self):
+        """Test that ranges are immutable and hashable by value."""
+        with pytest.raises(FrozenInstanceError):
+            YR_1900_1950.start = 1800
+        assert hash(YearRange(1900, 1950)) == hash(YR_1900_1950)
 
-class TestHistoricalEntity(unittest.TestCase):
+
+class TestHistoricalEntity:
     """Test HistoricalEntity functionality."""
 
-    def test_entity_creation(self):
+    def test_entity_creation(self, ussr):
         """Test creating a historical entity."""
-        entity = HistoricalEntity(
-            name="USSR",
-            canonical_name="Soviet Union",
-            entity_type="country",
-            valid_range=YearRange(1922, 1991),
-            alternative_names=["U.S.S.R.", "Soviet Union"]
-        )
-
-        self.assertEqual(entity.name, "USSR")
-        self.assertEqual(entity.canonical_name, "Soviet Union")
-        self.assertEqual(entity.entity_type, "country")
-
-    def test_was_valid_in(self):
+        assert ussr.name == "USSR"
+        assert ussr.canonical_name == "Soviet Union"
+        assert ussr.entity_type == "country"
+        assert ussr.alternative_names == ("U.S.S.R.", "Soviet Union")
+
+    def test_frozen(self, ussr):
+        """Test that entities are immutable and hashable."""
+        with pytest.raises(FrozenInstanceError):
+            ussr.name = "Russia"
+        assert {ussr: 1}[ussr] == 1
+
+    @pytest.mark.parametrize("year,expected", [
+        (1950, True),
+        (1922, True),
+        (1991, True),
+        (1921, False),
+        (1992, False),
+    ])
+    def test_was_valid_in(self, ussr, year, expected):
         """Test temporal validity checking."""
-        entity = HistoricalEntity(
-            name="USSR",
-            canonical_name="Soviet Union",
-            entity_type="country",
-            valid_range=YearRange(1922, 1991)
-        )
-
-        self.assertTrue(entity.was_valid_in(1950))
-        self.assertTrue(entity.was_valid_in(1922))
-        self.assertTrue(entity.was_valid_in(1991))
-        self.assertFalse(entity.was_valid_in(1921))
-        self.assertFalse(entity.was_valid_in(1992))
+        assert ussr.was_valid_in(year) is expected
 
 
-class TestDateSignal(unittest.TestCase):
+class TestDateSignal:
     """Test DateSignal functionality."""
 
     def test_signal_creation(self):
         """Test creating a date signal."""
-        signal = DateSignal(
-            signal_type=SignalType.ENTITY,
+        signal = _make_signal(
             description="USSR present",
             year_range=YearRange(1922, 1991),
             confidence=0.95,
@@ -107,21 +186,19 @@ class TestDateSignal(unittest.TestCase):
             reasoning="USSR existed 1922-1991"
         )
 
-        self.assertEqual(signal.signal_type, SignalType.ENTITY)
-        self.assertEqual(signal.confidence, 0.95)
+        assert signal.signal_type == SignalType.ENTITY
+        assert signal.confidence == 0.95
 
-    def test_invalid_confidence(self):
+    @pytest.mark.parametrize("confidence", [0.0, 0.5, 1.0])
+    def test_valid_confidence(self, confidence):
+        """Test that confidences in [0, 1], bounds included, are accepted."""
+        signal = _make_signal(confidence=confidence)
+
+        assert signal.confidence == confidence
+
+    @pytest.mark.parametrize("confidence", [-0.1, 1.5, float('nan')])
+    def test_invalid_confidence(self, confidence):
         """Test that invalid confidence raises error."""
-        with self.assertRaises(ValueError):
-            DateSignal(
-                signal_type=SignalType.ENTITY,
-                description="Test",
-                year_range=YearRange(1900, 1950),
-                confidence=1.5,  # Invalid
-                source="test",
-                reasoning="test"
-            )
-
-
-if __name__ == '__main__':
-    unittest.main()
+        with pytest.raises(ValueError, match="Confidence must be between 0 and 1"):
+            _make_signal(confidence=confidence)
+
@@ -0,0 +1,252 @@
+"""
+Unit tests for OCR text block batches and visualizer helpers.
+"""
+
+import numpy as np
+import pytest
+
+from models import TextBlock, BoundingBox, ProcessedImage
+from ocr import TextBlockBatch
+from ocr import visualizer
+from ocr.visualizer import OCRVisualizer, _as_batch, _confidence_heatmap, _dedupe
+
+
+def _batch(*boxes, conf=0.9):
+    """Build a batch from (text, x, y, w, h) tuples."""
+    return TextBlockBatch.from_text_blocks([
+        TextBlock(text, BoundingBox(x, y, w, h), conf) for text, x, y, w, h in boxes
+    ])
+
+
+def _reference_heatmap(batch, height, width):
+    """Per-box fill: the straightforward loop the difference array replaces."""
+    heatmap = np.zeros((height, width), dtype=np.float32)
+    for x, y, w, h, conf in zip(batch.xs, batch.ys, batch.ws, batch.hs, batch.confs):
+        heatmap[max(y, 0):max(y + h, 0), max(x, 0):max(x + w, 0)] += conf
+    return np.clip(heatmap, 0.0, 1.0)
+
+
+class TestTextBlockBatch:
+    """Test TextBlockBatch construction."""
+
+    def test_from_text_blocks(self):
+        """Test converting a list of TextBlocks to column arrays."""
+        blocks = [
+            TextBlock("USSR", BoundingBox(10, 20, 30, 40), 0.9),
+            TextBlock("1945", BoundingBox(5, 6, 7, 8), 0.5),
+        ]
+        batch = TextBlockBatch.from_text_blocks(blocks)
+
+        assert len(batch) == 2
+        assert batch.xs.tolist() == [10, 5]
+        assert batch.ys.tolist() == [20, 6]
+        assert batch.ws.tolist() == [30, 7]
+        assert batch.hs.tolist() == [40, 8]
+        assert batch.texts == ["USSR", "1945"]
+        assert float(batch.confs[0]) == pytest.approx(0.9, abs=1e-5)
+
+    def test_empty(self):
+        """Test that an empty block list yields an empty batch."""
+        batch = TextBlockBatch.from_text_blocks([])
+        assert len(batch) == 0
+        assert batch.xs.shape == (0,)
+
+    def test_mismatched_columns(self):
+        """Test that columns of different lengths are rejected."""
+        coords = np.zeros(2, dtype=np.int32)
+        confs = np.zeros(2, dtype=np.float32)
+
+        with pytest.raises(ValueError, match="same length"):
+            TextBlockBatch(coords, coords, coords, coords, confs, texts=[])
+
+
+class TestAsBatch:
+    """Test _as_batch input handling."""
+
+    def test_list_converted(self):
+        """Test that a list of TextBlocks becomes a batch."""
+        blocks = [TextBlock("Prussia", BoundingBox(1, 2, 3, 4), 0.8)]
+        batch = _as_batch(blocks)
+
+        assert isinstance(batch, TextBlockBatch)
+        assert batch.texts == ["Prussia"]
+        assert batch.xs.tolist() == [1]
+
+    def test_batch_passed_through(self):
+        """Test that an existing batch is used as-is, without a copy."""
+        batch = _batch(("Prussia", 1, 2, 3, 4))
+
+        assert _as_batch(batch) is batch
+
+
+class TestDedupe:
+    """Test _dedupe duplicate detection."""
+
+    def test_near_duplicates_collapse(self):
+        """Test that repeats within one 4px cell with equal size and text collapse."""
+        batch = _batch(
+            ("Prussia", 8, 8, 40, 12),
+            ("Prussia", 11, 10, 40, 12),  # same cell (2, 2)
+            ("Prussia", 12, 8, 40, 12),   # next cell over
+        )
+        deduped = _dedupe(batch)
+
+        assert deduped.xs.tolist() == [8, 12]
+        assert deduped.texts == ["Prussia", "Prussia"]
+
+    def test_distinct_text_in_same_cell_kept(self):
+        """Test that different words at the same spot are both kept."""
+        batch = _batch(("Prussia", 8, 8, 40, 12), ("Bavaria", 8, 8, 40, 12))
+
+        assert _dedupe(batch).texts == ["Prussia", "Bavaria"]
+
+    def test_different_size_kept(self):
+        """Test that same text and cell but a different box size is kept."""
+        batch = _batch(("Prussia", 8, 8, 40, 12), ("Prussia", 8, 8, 41, 12))
+
+        assert len(_dedupe(batch)) == 2
+
+    def test_no_duplicates_returns_same_batch(self):
+        """Test that a batch without duplicates is returned unchanged."""
+        batch = _batch(("Prussia", 8, 8, 40, 12), ("Bavaria", 80, 8, 40, 12))
+
+        assert _dedupe(batch) is batch
+
+
+class TestConfidenceHeatmap:
+    """Test the difference-array heatmap against a per-box loop."""
+
+    @pytest.fixture(params=["cumsum", "numba"])
+    def fill(self, request, monkeypatch):
+        """Run each test with the numpy cumsum path and the numba kernel."""
+        if request.param == "numba":
+            if visualizer._fill_heatmap is None:
+                pytest.skip("numba not installed")
+            monkeypatch.setattr(visualizer, "_NUMBA_HEATMAP_MIN_PIXELS", 0)
+        return request.param
+
+    def test_overlapping_and_clipped_boxes(self, fill):
+        """Test overlaps, edge-clipped, outside and empty boxes."""
+        batch = TextBlockBatch.from_text_blocks([
+            TextBlock("a", BoundingBox(2, 2, 10, 6), 0.6),
+            TextBlock("b", BoundingBox(8, 4, 10, 6), 0.7),    # overlaps a, sum capped
+            TextBlock("c", BoundingBox(5, 5, 4, 4), 0.2),     # inside both
+            TextBlock("d", BoundingBox(-3, -2, 6, 5), 0.5),   # clipped at top left
+            TextBlock("e", BoundingBox(25, 15, 10, 10), 0.4), # clipped at bottom right
+            TextBlock("f", BoundingBox(40, 30, 5, 5), 0.9),   # fully outside
+            TextBlock("g", BoundingBox(10, 10, 0, 5), 0.9),   # empty
+        ])
+        heatmap = _confidence_heatmap(batch, 20, 30)
+
+        assert heatmap.shape == (20, 30)
+        np.testing.assert_allclose(heatmap, _reference_heatmap(batch, 20, 30), atol=1e-5)
+        assert heatmap[5, 9] == pytest.approx(1.0)
+
+    def test_random_boxes(self, fill):
+        """Test many random boxes, including ones running past every edge."""
+        rng = np.random.default_rng(0)
+        n = 200
+        batch = TextBlockBatch(
+            xs=rng.integers(-10, 60, n, dtype=np.int32),
+            ys=rng.integers(-10, 40, n, dtype=np.int32),
+            ws=rng.integers(0, 20, n, dtype=np.int32),
+            hs=rng.integers(0, 20, n, dtype=np.int32),
+            confs=rng.random(n, dtype=np.float32) * 0.2,
+            texts=["x"] * n
+        )
+
+        np.testing.assert_allclose(
+            _confidence_heatmap(batch, 37, 53), _reference_heatmap(batch, 37, 53), atol=1e-5
+        )
+
+    def test_empty_batch(self, fill):
+        """Test that no blocks give an all-zero map."""
+        heatmap = _confidence_heatmap(_batch(), 4, 5)
+
+        assert heatmap.shape == (4, 5)
+        assert not heatmap.any()
+
+
+class RecordingCV2:
+    """cv2 stand-in that records drawing calls instead of rasterizing."""
+
+    FONT_HERSHEY_SIMPLEX = LINE_AA = COLORMAP_JET = 0
+
+    def __init__(self):
+        self.texts = []
+        self.rectangles = 0
+        self.boxes = 0
+
+    def polylines(self, image, polys, closed, color, thickness):
+        self.boxes += len(polys)
+
+    def rectangle(self, image, pt1, pt2, color, thickness):
+        self.rectangles += 1
+
+    def putText(self, image, text, org, font, scale, color, thickness, line_type):
+        self.texts.append(text)
+
+    def getTextSize(self, text, font, scale, thickness):
+        return (8 * len(text), 10), 2
+
+    def resize(self, image, size):
+        return np.zeros((size[1], size[0], 3), dtype=np.uint8)
+
+    def applyColorMap(self, image, colormap):
+        return np.repeat(image[:, :, None], 3, axis=2)
+
+    def addWeighted(self, a, alpha, b, beta, gamma):
+        return a
+
+
+class TestOCRVisualizer:
+    """Test label drawing in OCRVisualizer."""
+
+    BLOCKS = [
+        TextBlock("Prussia", BoundingBox(10, 20, 30, 10), 0.9),
+        TextBlock("Bavaria", BoundingBox(40, 30, 25, 10), 0.8),
+    ]
+
+    @pytest.fixture
+    def cv2(self, monkeypatch):
+        fake = RecordingCV2()
+        monkeypatch.setattr(visualizer, "cv2", fake)
+        visualizer._label_size.cache_clear()
+        yield fake
+        visualizer._label_size.cache_clear()
+
+    @pytest.fixture
+    def image(self):
+        return ProcessedImage(
+            image_data=np.zeros((50, 80, 3), dtype=np.uint8),
+            original_path="map.png",
+            width=80,
+            height=50
+        )
+
+    def test_labels_drawn_by_default(self, cv2, image):
+        """Test that each box gets a label with its confidence by default."""
+        OCRVisualizer().visualize_text_blocks(image, self.BLOCKS)
+
+        assert cv2.boxes == 2
+        assert cv2.texts == ["Prussia (0.90)", "Bavaria (0.80)"]
+        assert cv2.rectangles == 2
+
+    def test_draw_labels_false(self, cv2, image):
+        """Test that draw_labels=False draws the boxes only."""
+        OCRVisualizer().visualize_text_blocks(image, self.BLOCKS, draw_labels=False)
+
+        assert cv2.boxes == 2
+        assert cv2.texts == []
+        assert cv2.rectangles == 0
+
+    def test_summary_has_no_box_labels(self, cv2, image):
+        """Test that the summary's box panel is drawn without labels."""
+        summary = OCRVisualizer().create_summary_visualization(image, self.BLOCKS)
+
+        assert summary.shape[0] == 600
+        assert cv2.boxes == 2
+        assert cv2.rectangles == 0
+        # Only the word map's plain words and the panel titles are drawn
+        assert not any("(0." in text for text in cv2.texts)
+        assert {"Prussia", "Bavaria", "Detected Text"} <= set(cv2.texts)